@@ -2,6 +2,7 @@
 
 from .models import (
     MarketData,
+    MarketDataBatch,
     Signal,
     TradeRequest,
     TradeResult,
@@ -12,6 +13,7 @@ from .models import (
     ValidationResult,
     SignalType,
     TradeDirection,
+    ErrorCode,
 )
 
 from .config import (
@@ -33,6 +35,7 @@ from .utils import (
     format_currency,
     calculate_percentage,
     validate_market_data,
+    validate_market_data_batch,
     validate_signal,
     validate_trade_request,
     is_numeric,
@@ -57,6 +60,7 @@ from .utils import (
 __all__ = [
     # Models
     "MarketData",
+    "MarketDataBatch",
     "Signal",
     "TradeRequest",
     "TradeResult",
@@ -67,6 +71,7 @@ __all__ = [
     "ValidationResult",
     "SignalType",
     "TradeDirection",
+    "ErrorCode",
     # Configuration
     "TradingConfig",
     "APIConfig",
@@ -82,6 +87,7 @@ __all__ = [
     "format_currency",
     "calculate_percentage",
     "validate_market_data",
+    "validate_market_data_batch",
     "validate_signal",
     "validate_trade_request",
     "is_numeric",
@@ -1,24 +1,72 @@
 """Database utilities for Pocket Option Trading Bot."""
 
+import dataclasses
 import sqlite3
 import logging
+import time
 from datetime import datetime, date
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from contextlib import contextmanager
 
 from .models import TradeResult, PerformanceMetrics, TradeDirection
 from .config import get_config_manager
 
 
+# SQL statements reused verbatim so sqlite3's statement cache can serve them
+_INSERT_TRADE_SQL = """
+    INSERT OR REPLACE INTO trades 
+    (trade_id, symbol, direction, amount, entry_price, 
+     exit_price, profit_loss, is_win, timestamp)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Trade filter predicates in emission order; bit i of a filter mask enables
+# predicate i. Timestamp bounds come first as they are normally the most selective.
+_TRADE_FILTER_PREDICATES = ("timestamp >= ?", "timestamp <= ?", "symbol = ?")
+_LIMIT_BIT = 1 << len(_TRADE_FILTER_PREDICATES)
+
+_TRADE_WHERE_BY_MASK = {
+    mask: " AND ".join(
+        predicate for bit, predicate in enumerate(_TRADE_FILTER_PREDICATES)
+        if mask & (1 << bit)
+    ) or "1=1"
+    for mask in range(_LIMIT_BIT)
+}
+
+# Every filter combination maps to one fixed SQL text
+_SELECT_TRADES_SQL_BY_MASK = {
+    mask: (
+        f"SELECT * FROM trades WHERE {_TRADE_WHERE_BY_MASK[mask & (_LIMIT_BIT - 1)]} "
+        f"ORDER BY timestamp DESC" + (" LIMIT ?" if mask & _LIMIT_BIT else "")
+    )
+    for mask in range(_LIMIT_BIT << 1)
+}
+_COUNT_TRADES_SQL_BY_MASK = {
+    mask: f"SELECT COUNT(*) FROM trades WHERE {where}"
+    for mask, where in _TRADE_WHERE_BY_MASK.items()
+}
+
+# Prepared statements kept per connection (sqlite3 default is 128)
+_CACHED_STATEMENTS = 256
+
+
 class DatabaseManager:
     """Manages SQLite database operations for the trading bot."""
     
-    def __init__(self, db_path: Optional[str] = None):
+    def __init__(self, db_path: Optional[str] = None, fast_mode: bool = False,
+                 metrics_cache_ttl: float = 0.0):
         """Initialize database manager.
         
         Args:
-            db_path: Path to SQLite database file
+            db_path: Path to SQLite database file, a "file:" URI, or ":memory:".
+                In-memory databases (including "file:...?mode=memory" URIs)
+                are kept alive for the manager's lifetime
+            fast_mode: Disable fsync on commit (synchronous=OFF); only safe
+                for throwaway databases such as test fixtures
+            metrics_cache_ttl: Seconds a computed get_performance_metrics
+                result is reused (default 0 disables caching). Only this
+                manager's own writes invalidate it early
         """
         if db_path is None:
             config = get_config_manager().get_app_config()
@@ -26,10 +74,26 @@ class DatabaseManager:
             db_path = config.database_url.replace("sqlite:///", "")
         
         self.db_path = Path(db_path)
+        self._database = str(db_path)
+        self._is_uri = self._database.startswith("file:")
+        self.fast_mode = fast_mode
         self.logger = logging.getLogger("trading_bot.database")
         
-        # Create database directory if it doesn't exist
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Performance metrics cache: days -> (computed_at, metrics)
+        self.metrics_cache_ttl = metrics_cache_ttl
+        self._metrics_cache: Dict[int, Tuple[float, PerformanceMetrics]] = {}
+        
+        # In-memory databases vanish when their connection closes, so hold one open
+        self._persistent_conn: Optional[sqlite3.Connection] = None
+        if self._database == ":memory:" or (self._is_uri and "mode=memory" in self._database):
+            self._persistent_conn = self._connect()
+            # Page cache and temp-table settings last only as long as the
+            # connection, so they pay off only on the one kept open
+            self._persistent_conn.execute("PRAGMA temp_store=MEMORY")
+            self._persistent_conn.execute("PRAGMA cache_size=-20000")  # ~20 MB page cache
+        elif not self._is_uri:
+            # Create database directory if it doesn't exist
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Initialize database schema
         self._initialize_schema()
@@ -39,8 +103,10 @@ class DatabaseManager:
         """Get database connection with automatic cleanup."""
         conn = None
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row  # Enable dict-like access
+            if self._persistent_conn is not None:
+                conn = self._persistent_conn
+            else:
+                conn = self._connect()
             yield conn
         except Exception as e:
             if conn:
@@ -48,14 +114,40 @@ class DatabaseManager:
             self.logger.error(f"Database error: {e}")
             raise
         finally:
-            if conn:
+            if conn and conn is not self._persistent_conn:
                 conn.close()
     
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new connection with row access (and no fsync in fast mode)."""
+        conn = sqlite3.connect(
+            self._database, uri=self._is_uri, cached_statements=_CACHED_STATEMENTS
+        )
+        conn.row_factory = sqlite3.Row  # Enable dict-like access
+        
+        # synchronous is per connection; it changes durability, so every connection gets it
+        if self.fast_mode:
+            conn.execute("PRAGMA synchronous=OFF")
+        
+        return conn
+    
+    def invalidate_metrics_cache(self) -> None:
+        """Drop cached performance metrics after the trades table changes."""
+        self._metrics_cache.clear()
+    
+    def close(self) -> None:
+        """Close the persistent connection held for in-memory databases."""
+        if self._persistent_conn is not None:
+            self._persistent_conn.close()
+            self._persistent_conn = None
+    
     def _initialize_schema(self) -> None:
         """Initialize database schema with required tables."""
         with self.get_connection() as conn:
             cursor = conn.cursor()
             
+            # WAL is stored in the database file, so setting it once covers later connections
+            cursor.execute("PRAGMA journal_mode=WAL")
+            
             # Create trades table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS trades (
@@ -69,10 +161,20 @@ class DatabaseManager:
                     profit_loss REAL,
                     is_win BOOLEAN,
                     timestamp DATETIME NOT NULL,
+                    trade_date TEXT GENERATED ALWAYS AS (substr(timestamp, 1, 10)) STORED,
                     created_at DATETIME DEFAULT CURRENT_TIMESTAMP
                 )
             """)
             
+            # Databases created before trade_date existed get it added as a
+            # VIRTUAL column (SQLite cannot ALTER in a STORED one); both index alike
+            columns = {row['name'] for row in cursor.execute("PRAGMA table_xinfo(trades)")}
+            if "trade_date" not in columns:
+                cursor.execute("""
+                    ALTER TABLE trades ADD COLUMN trade_date TEXT
+                    GENERATED ALWAYS AS (substr(timestamp, 1, 10)) VIRTUAL
+                """)
+            
             # Create daily performance table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS daily_performance (
@@ -89,9 +191,12 @@ class DatabaseManager:
             """)
             
             # Create indexes for better performance
+            # Composite index serves symbol-only lookups as well as
+            # symbol + time-range filters, superseding idx_trades_symbol
+            cursor.execute("DROP INDEX IF EXISTS idx_trades_symbol")
             cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_trades_symbol 
-                ON trades(symbol)
+                CREATE INDEX IF NOT EXISTS idx_trades_symbol_ts 
+                ON trades(symbol, timestamp)
             """)
             
             cursor.execute("""
@@ -99,6 +204,12 @@ class DatabaseManager:
                 ON trades(timestamp)
             """)
             
+            # Day "partition" index used by daily aggregation and cleanup
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_trades_trade_date 
+                ON trades(trade_date)
+            """)
+            
             cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_daily_performance_date 
                 ON daily_performance(date)
@@ -120,24 +231,10 @@ class DatabaseManager:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute("""
-                    INSERT OR REPLACE INTO trades 
-                    (trade_id, symbol, direction, amount, entry_price, 
-                     exit_price, profit_loss, is_win, timestamp)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    trade.trade_id,
-                    trade.symbol,
-                    trade.direction.value,
-                    trade.amount,
-                    trade.entry_price,
-                    trade.exit_price,
-                    trade.profit_loss,
-                    trade.is_win,
-                    trade.timestamp
-                ))
+                cursor.execute(_INSERT_TRADE_SQL, self._trade_to_row(trade))
                 
                 conn.commit()
+                self.invalidate_metrics_cache()
                 self.logger.info(f"Trade {trade.trade_id} saved successfully")
                 return True
                 
@@ -145,6 +242,47 @@ class DatabaseManager:
             self.logger.error(f"Failed to save trade {trade.trade_id}: {e}")
             return False
     
+    def save_trades_bulk(self, trades: List[TradeResult]) -> bool:
+        """Save multiple trade results in a single transaction.
+        
+        Args:
+            trades: TradeResult objects to save
+            
+        Returns:
+            True if all trades were saved successfully, False otherwise
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.executemany(
+                    _INSERT_TRADE_SQL, [self._trade_to_row(trade) for trade in trades]
+                )
+                
+                conn.commit()
+                self.invalidate_metrics_cache()
+                self.logger.info(f"{len(trades)} trades saved successfully")
+                return True
+                
+        except Exception as e:
+            self.logger.error(f"Failed to save {len(trades)} trades: {e}")
+            return False
+    
+    @staticmethod
+    def _trade_to_row(trade: TradeResult) -> tuple:
+        """Convert a trade result to a row tuple for the trades table."""
+        return (
+            trade.trade_id,
+            trade.symbol,
+            trade.direction.value,
+            trade.amount,
+            trade.entry_price,
+            trade.exit_price,
+            trade.profit_loss,
+            trade.is_win,
+            trade.timestamp
+        )
+    
     def get_trades(self, 
                    symbol: Optional[str] = None,
                    start_date: Optional[datetime] = None,
@@ -165,28 +303,13 @@ class DatabaseManager:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                query = "SELECT * FROM trades WHERE 1=1"
-                params = []
-                
-                if symbol:
-                    query += " AND symbol = ?"
-                    params.append(symbol)
-                
-                if start_date:
-                    query += " AND timestamp >= ?"
-                    params.append(start_date)
-                
-                if end_date:
-                    query += " AND timestamp <= ?"
-                    params.append(end_date)
-                
-                query += " ORDER BY timestamp DESC"
+                mask, params = self._build_trade_filters(symbol, start_date, end_date)
                 
                 if limit:
-                    query += " LIMIT ?"
+                    mask |= _LIMIT_BIT
                     params.append(limit)
                 
-                cursor.execute(query, params)
+                cursor.execute(_SELECT_TRADES_SQL_BY_MASK[mask], params)
                 rows = cursor.fetchall()
                 
                 trades = []
@@ -210,6 +333,52 @@ class DatabaseManager:
             self.logger.error(f"Failed to get trades: {e}")
             return []
     
+    def count_trades(self,
+                     symbol: Optional[str] = None,
+                     start_date: Optional[datetime] = None,
+                     end_date: Optional[datetime] = None) -> int:
+        """Count trades matching the same filters as get_trades.
+        
+        Args:
+            symbol: Filter by currency pair
+            start_date: Filter trades after this date
+            end_date: Filter trades before this date
+            
+        Returns:
+            Number of matching trades (0 on error)
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                
+                mask, params = self._build_trade_filters(symbol, start_date, end_date)
+                cursor.execute(_COUNT_TRADES_SQL_BY_MASK[mask], params)
+                
+                return cursor.fetchone()[0]
+                
+        except Exception as e:
+            self.logger.error(f"Failed to count trades: {e}")
+            return 0
+    
+    @staticmethod
+    def _build_trade_filters(symbol: Optional[str],
+                             start_date: Optional[datetime],
+                             end_date: Optional[datetime]) -> Tuple[int, List[Any]]:
+        """Build the filter mask and parameters for trade queries.
+        
+        Returns:
+            Tuple of (mask into the precomputed SQL tables, bound parameters)
+        """
+        mask = 0
+        params: List[Any] = []
+        
+        for bit, value in enumerate((start_date, end_date, symbol)):
+            if value:
+                mask |= 1 << bit
+                params.append(value)
+        
+        return mask, params
+    
     def update_daily_performance(self, target_date: Optional[date] = None) -> bool:
         """Update daily performance metrics.
         
@@ -234,7 +403,7 @@ class DatabaseManager:
                         SUM(CASE WHEN is_win = 0 THEN 1 ELSE 0 END) as losing_trades,
                         COALESCE(SUM(profit_loss), 0) as total_profit_loss
                     FROM trades 
-                    WHERE DATE(timestamp) = ?
+                    WHERE trade_date = ?
                 """, (target_date,))
                 
                 result = cursor.fetchone()
@@ -278,6 +447,11 @@ class DatabaseManager:
         Returns:
             PerformanceMetrics object
         """
+        cached = self._metrics_cache.get(days)
+        if cached is not None and time.monotonic() - cached[0] < self.metrics_cache_ttl:
+            # Hand out a copy so callers cannot alter the cached instance
+            return dataclasses.replace(cached[1])
+        
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
@@ -310,7 +484,7 @@ class DatabaseManager:
                 max_consecutive_wins = self._get_max_consecutive_wins(cursor, days)
                 max_consecutive_losses = self._get_max_consecutive_losses(cursor, days)
                 
-                return PerformanceMetrics(
+                metrics = PerformanceMetrics(
                     total_trades=total_trades,
                     winning_trades=winning_trades,
                     losing_trades=losing_trades,
@@ -322,6 +496,10 @@ class DatabaseManager:
                     max_consecutive_losses=max_consecutive_losses
                 )
                 
+                if self.metrics_cache_ttl > 0:
+                    self._metrics_cache[days] = (time.monotonic(), dataclasses.replace(metrics))
+                return metrics
+                
         except Exception as e:
             self.logger.error(f"Failed to get performance metrics: {e}")
             # Return empty metrics on error
@@ -395,7 +573,7 @@ class DatabaseManager:
                 # Delete old trades
                 cursor.execute("""
                     DELETE FROM trades 
-                    WHERE timestamp < datetime('now', '-{} days')
+                    WHERE trade_date < date('now', '-{} days')
                 """.format(days_to_keep))
                 
                 deleted_trades = cursor.rowcount
@@ -409,6 +587,7 @@ class DatabaseManager:
                 deleted_performance = cursor.rowcount
                 
                 conn.commit()
+                self.invalidate_metrics_cache()
                 
                 self.logger.info(
                     f"Cleanup completed: {deleted_trades} trades, "
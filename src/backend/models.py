@@ -3,7 +3,10 @@
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from operator import attrgetter
+from typing import List, Optional
+
+import numpy as np
 
 
 class SignalType(Enum):
@@ -18,7 +21,18 @@ class TradeDirection(Enum):
     PUT = "PUT"
 
 
-@dataclass
+class ErrorCode(Enum):
+    """Reasons a trade request can fail risk validation."""
+    TRADING_PAUSED = "TRADING_PAUSED"
+    NON_POSITIVE_AMOUNT = "NON_POSITIVE_AMOUNT"
+    INSUFFICIENT_BALANCE = "INSUFFICIENT_BALANCE"
+    EXCEEDS_MAX_TRADE_PERCENT = "EXCEEDS_MAX_TRADE_PERCENT"
+    DAILY_LOSS_LIMIT = "DAILY_LOSS_LIMIT"
+    CONSECUTIVE_LOSS_LIMIT = "CONSECUTIVE_LOSS_LIMIT"
+    DEMO_MODE_VIOLATION = "DEMO_MODE_VIOLATION"
+
+
+@dataclass(slots=True)
 class MarketData:
     """Market data structure for candlestick information."""
     
@@ -45,7 +59,48 @@ class MarketData:
             raise ValueError("Low price cannot be greater than open or close price")
 
 
-@dataclass
+@dataclass(slots=True)
+class MarketDataBatch:
+    """Columnar (structure-of-arrays) market data for a single symbol."""
+    
+    symbol: str
+    timestamp: np.ndarray  # datetime64[us]
+    open_price: np.ndarray
+    high_price: np.ndarray
+    low_price: np.ndarray
+    close_price: np.ndarray
+    volume: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.close_price)
+    
+    @classmethod
+    def from_records(cls, records: List[MarketData]) -> "MarketDataBatch":
+        """Build a batch from chronologically ordered MarketData records."""
+        if not records:
+            raise ValueError("Market data cannot be empty")
+        
+        count = len(records)
+        
+        def column(name: str) -> np.ndarray:
+            return np.fromiter(map(attrgetter(name), records), dtype=np.float64, count=count)
+        
+        return cls(
+            symbol=records[-1].symbol,
+            timestamp=np.array([record.timestamp for record in records], dtype="datetime64[us]"),
+            open_price=column("open_price"),
+            high_price=column("high_price"),
+            low_price=column("low_price"),
+            close_price=column("close_price"),
+            volume=column("volume"),
+        )
+    
+    def latest_timestamp(self) -> datetime:
+        """Timestamp of the most recent candle."""
+        return self.timestamp[-1].item()
+
+
+@dataclass(slots=True)
 class Signal:
     """Trading signal structure."""
     
@@ -69,7 +124,7 @@ class Signal:
             raise ValueError("Current price cannot be negative")
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeRequest:
     """Trade request structure."""
     
@@ -87,7 +142,7 @@ class TradeRequest:
             raise ValueError("Expiration time must be positive")
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeResult:
     """Trade result structure."""
     
@@ -111,7 +166,7 @@ class TradeResult:
             raise ValueError("Exit price cannot be negative")
 
 
-@dataclass
+@dataclass(slots=True)
 class Balance:
     """Account balance structure."""
     
@@ -130,7 +185,7 @@ class Balance:
             raise ValueError("Available balance cannot exceed total balance")
 
 
-@dataclass
+@dataclass(slots=True)
 class NotificationMessage:
     """Notification message structure."""
     
@@ -147,7 +202,7 @@ class NotificationMessage:
             raise ValueError(f"Priority must be one of: {valid_priorities}")
 
 
-@dataclass
+@dataclass(slots=True)
 class TradingStatus:
     """Trading engine status structure."""
     
@@ -172,7 +227,7 @@ class TradingStatus:
             raise ValueError("Wins + losses cannot exceed total trades")
 
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceMetrics:
     """Performance metrics structure."""
     
@@ -200,13 +255,14 @@ class PerformanceMetrics:
             raise ValueError("Win rate must be between 0 and 100")
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Validation result structure."""
     
     is_valid: bool
     error_message: Optional[str] = None
     warnings: list[str] = None
+    error_code: Optional[ErrorCode] = None
     
     def __post_init__(self):
         """Initialize warnings list if None."""
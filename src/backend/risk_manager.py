@@ -10,7 +10,8 @@ from .models import (
     TradeResult, 
     Balance, 
     ValidationResult,
-    TradingStatus
+    TradingStatus,
+    ErrorCode
 )
 from .config import TradingConfig
 
@@ -60,7 +61,8 @@ class RiskManager:
         if self.is_trading_paused():
             return ValidationResult(
                 is_valid=False,
-                error_message=f"Trading is paused: {self.pause_reason}"
+                error_message=f"Trading is paused: {self.pause_reason}",
+                error_code=ErrorCode.TRADING_PAUSED
             )
         
         # Validate trade amount against balance
@@ -163,11 +165,7 @@ class RiskManager:
         self.trade_history.append(trade_result)
         
         # Keep only today's trades for performance
-        today = datetime.now().date()
-        self.trade_history = [
-            trade for trade in self.trade_history 
-            if trade.timestamp.date() == today
-        ]
+        self._prune_trade_history()
         
         # Check for consecutive losses
         consecutive_losses = self._count_consecutive_losses()
@@ -176,6 +174,40 @@ class RiskManager:
             
         logger.info(f"Recorded trade result: {trade_result.trade_id} - {'WIN' if trade_result.is_win else 'LOSS'}")
     
+    def record_trade_results(self, trade_results: List[TradeResult]) -> None:
+        """
+        Record several trade results in order with a single history pass.
+        
+        Equivalent to calling record_trade_result for each trade, including
+        pausing if a loss streak reaches the limit partway through the batch.
+        
+        Args:
+            trade_results: Completed trade results, oldest first
+        """
+        self._prune_trade_history()
+        
+        # Walk the batch as record_trade_result would, tracking the streak
+        today = datetime.now().date()
+        consecutive_losses = self._count_consecutive_losses()
+        triggering_streak = None
+        for trade in trade_results:
+            if trade.timestamp.date() != today:
+                continue  # Would be pruned immediately
+            if trade.is_win is False:
+                consecutive_losses += 1
+            elif trade.is_win is True:
+                consecutive_losses = 0
+            if consecutive_losses >= self.config.consecutive_loss_limit:
+                triggering_streak = consecutive_losses
+        
+        self.trade_history.extend(trade_results)
+        self._prune_trade_history()
+        
+        if triggering_streak is not None:
+            self.should_pause_trading(triggering_streak)
+            
+        logger.info(f"Recorded {len(trade_results)} trade results")
+    
     def get_risk_metrics(self, current_balance: float) -> RiskMetrics:
         """
         Get current risk metrics.
@@ -255,20 +287,23 @@ class RiskManager:
         if amount <= 0:
             return ValidationResult(
                 is_valid=False,
-                error_message="Trade amount must be positive"
+                error_message="Trade amount must be positive",
+                error_code=ErrorCode.NON_POSITIVE_AMOUNT
             )
             
         if amount > available_balance:
             return ValidationResult(
                 is_valid=False,
-                error_message=f"Insufficient balance: ${amount:.2f} requested, ${available_balance:.2f} available"
+                error_message=f"Insufficient balance: ${amount:.2f} requested, ${available_balance:.2f} available",
+                error_code=ErrorCode.INSUFFICIENT_BALANCE
             )
             
         max_trade_amount = available_balance * (self.config.max_trade_percent / 100)
         if amount > max_trade_amount:
             return ValidationResult(
                 is_valid=False,
-                error_message=f"Trade amount ${amount:.2f} exceeds maximum allowed ${max_trade_amount:.2f} ({self.config.max_trade_percent}% of balance)"
+                error_message=f"Trade amount ${amount:.2f} exceeds maximum allowed ${max_trade_amount:.2f} ({self.config.max_trade_percent}% of balance)",
+                error_code=ErrorCode.EXCEEDS_MAX_TRADE_PERCENT
             )
             
         return ValidationResult(is_valid=True)
@@ -280,7 +315,8 @@ class RiskManager:
             daily_loss_percent = (daily_loss / self.daily_start_balance) * 100 if self.daily_start_balance else 0
             return ValidationResult(
                 is_valid=False,
-                error_message=f"Daily loss limit exceeded: {daily_loss_percent:.2f}% (max {self.config.max_daily_loss_percent}%)"
+                error_message=f"Daily loss limit exceeded: {daily_loss_percent:.2f}% (max {self.config.max_daily_loss_percent}%)",
+                error_code=ErrorCode.DAILY_LOSS_LIMIT
             )
         return ValidationResult(is_valid=True)
     
@@ -290,7 +326,8 @@ class RiskManager:
         if consecutive_losses >= self.config.consecutive_loss_limit:
             return ValidationResult(
                 is_valid=False,
-                error_message=f"Consecutive loss limit reached: {consecutive_losses} losses (max {self.config.consecutive_loss_limit})"
+                error_message=f"Consecutive loss limit reached: {consecutive_losses} losses (max {self.config.consecutive_loss_limit})",
+                error_code=ErrorCode.CONSECUTIVE_LOSS_LIMIT
             )
         return ValidationResult(is_valid=True)
     
@@ -299,10 +336,19 @@ class RiskManager:
         if self.config.demo_mode and not request.is_demo:
             return ValidationResult(
                 is_valid=False,
-                error_message="Real trading is disabled. System is in demo mode."
+                error_message="Real trading is disabled. System is in demo mode.",
+                error_code=ErrorCode.DEMO_MODE_VIOLATION
             )
         return ValidationResult(is_valid=True)
     
+    def _prune_trade_history(self) -> None:
+        """Drop trades that were not made today."""
+        today = datetime.now().date()
+        self.trade_history = [
+            trade for trade in self.trade_history 
+            if trade.timestamp.date() == today
+        ]
+    
     def _count_consecutive_losses(self) -> int:
         """Count consecutive losses from most recent trades."""
         consecutive_losses = 0
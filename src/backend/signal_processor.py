@@ -1,17 +1,46 @@
 """Signal Processing Engine for Pocket Option Trading Bot."""
 
+import bisect
+import functools
 import logging
 import asyncio
+from collections import deque
 from datetime import datetime
-from typing import List, Optional, Dict, Any
-from dataclasses import dataclass
+from typing import List, Optional, Dict, Any, Tuple, Union, Deque
+from dataclasses import dataclass, replace
 
-from .models import MarketData, Signal, SignalType
-from .api_manager import get_api_manager
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .models import MarketData, MarketDataBatch, Signal, SignalType
 
 
 logger = logging.getLogger(__name__)
 
+# Lower confidence bound of each strength label above "Very Weak"
+_STRENGTH_BOUNDS = (0.2, 0.4, 0.6, 0.8)
+_STRENGTH_LABELS = ("Very Weak", "Weak", "Moderate", "Strong", "Very Strong")
+
+
+async def get_api_manager():
+    """Get the global API manager, importing it (and aiohttp/requests) on first use."""
+    from .api_manager import get_api_manager as _get_api_manager
+    return await _get_api_manager()
+
+
+@functools.lru_cache(maxsize=32)
+def _wilder_weights(period: int, tail: int) -> np.ndarray:
+    """Read-only weights that fold ``tail`` Wilder smoothing steps into one dot product."""
+    decay = (period - 1) / period
+    weights = decay ** np.arange(tail - 1, -1, -1, dtype=np.float64) / period
+    weights.flags.writeable = False
+    return weights
+
+
+def _sliding_window_mean(arr: np.ndarray, n: int) -> np.ndarray:
+    """Mean of every length-n window of arr, oldest window first."""
+    return sliding_window_view(arr, n).mean(axis=-1)
+
 
 @dataclass
 class TechnicalIndicators:
@@ -47,6 +76,14 @@ class SignalProcessor:
         self.sma_weight = 0.3
         self.validation_weight = 0.3
         
+        # Streaming indicator state, set by seed_indicators():
+        # (avg_gain, avg_loss, last_price) and (running_sum, sma window)
+        self._rsi_state: Optional[Tuple[float, float, float]] = None
+        self._sma_state: Optional[Tuple[float, Deque[float]]] = None
+        
+        # Last indicators per symbol, keyed by (latest timestamp, periods, close prices)
+        self._indicator_cache: Dict[str, Tuple[tuple, TechnicalIndicators]] = {}
+        
         logger.info(f"SignalProcessor initialized with RSI period: {rsi_period}, SMA period: {sma_period}")
     
     async def _get_api_manager(self):
@@ -78,28 +115,43 @@ class SignalProcessor:
         if period <= 0:
             raise ValueError("RSI period must be positive")
         
-        if not prices or any(price <= 0 for price in prices):
+        arr = np.asarray(prices, dtype=np.float64)
+        if arr.size == 0 or arr.min() <= 0:
             raise ValueError("All prices must be positive")
         
-        # Calculate price changes
-        deltas = [prices[i] - prices[i-1] for i in range(1, len(prices))]
-        
-        # Separate gains and losses
-        gains = [delta if delta > 0 else 0 for delta in deltas]
-        losses = [-delta if delta < 0 else 0 for delta in deltas]
+        return self._rsi_from_array(arr, period)
+    
+    @staticmethod
+    def _rsi_from_array(arr: np.ndarray, period: int) -> float:
+        """Wilder RSI of an already validated float64 price array."""
+        avg_gain, avg_loss = SignalProcessor._wilder_averages(arr, period)
+        return SignalProcessor._rsi_from_averages(avg_gain, avg_loss)
+    
+    @staticmethod
+    def _wilder_averages(arr: np.ndarray, period: int) -> Tuple[float, float]:
+        """Wilder-smoothed average gain and loss of a validated float64 price array."""
+        # Calculate price changes and separate gains and losses
+        deltas = np.diff(arr)
+        gains = np.maximum(deltas, 0.0)
+        losses = -np.minimum(deltas, 0.0)
         
         # Calculate initial average gain and loss
-        if len(gains) < period:
-            raise ValueError(f"Insufficient data for RSI calculation")
-        
-        avg_gain = sum(gains[:period]) / period
-        avg_loss = sum(losses[:period]) / period
-        
-        # Calculate RSI using Wilder's smoothing method
-        for i in range(period, len(gains)):
-            avg_gain = (avg_gain * (period - 1) + gains[i]) / period
-            avg_loss = (avg_loss * (period - 1) + losses[i]) / period
-        
+        avg_gain = gains[:period].mean()
+        avg_loss = losses[:period].mean()
+        
+        # Wilder's smoothing, avg = (avg * (period - 1) + x) / period, unrolled
+        # into one weighted sum: each later delta decays by (period - 1) / period
+        tail = len(deltas) - period
+        if tail > 0:
+            decay = (period - 1) / period
+            weights = _wilder_weights(period, tail)
+            avg_gain = avg_gain * decay ** tail + gains[period:] @ weights
+            avg_loss = avg_loss * decay ** tail + losses[period:] @ weights
+        return float(avg_gain), float(avg_loss)
+    
+    @staticmethod
+    def _rsi_from_averages(avg_gain: float, avg_loss: float) -> float:
+        """RSI from Wilder-smoothed average gain and loss."""
         # Avoid division by zero
         if avg_loss == 0:
             return 100.0
@@ -127,28 +179,56 @@ class SignalProcessor:
         if period is None:
             period = self.sma_period
             
+        arr = self._validate_sma_prices(prices, period)
+        
+        # Calculate SMA using the most recent 'period' prices
+        sma = float(arr[-period:].mean())
+        
+        logger.debug(f"SMA calculated: {sma:.5f} (period: {period})")
+        return sma
+    
+    def calculate_sma_series(self, prices: List[float], period: int = None) -> np.ndarray:
+        """
+        Calculate the rolling Simple Moving Average over a price series.
+        
+        Args:
+            prices: List of closing prices (most recent last)
+            period: SMA period (default uses instance period)
+            
+        Returns:
+            Array of SMA values, one per full window; the last equals calculate_sma
+            
+        Raises:
+            ValueError: If insufficient data or invalid parameters
+        """
+        if period is None:
+            period = self.sma_period
+        
+        arr = self._validate_sma_prices(prices, period)
+        return _sliding_window_mean(arr, period)
+    
+    def _validate_sma_prices(self, prices: List[float], period: int) -> np.ndarray:
+        """Validate SMA inputs and return prices as a float64 array."""
         if len(prices) < period:
             raise ValueError(f"Need at least {period} prices for SMA calculation, got {len(prices)}")
         
         if period <= 0:
             raise ValueError("SMA period must be positive")
         
-        if not prices or any(price <= 0 for price in prices):
+        arr = np.asarray(prices, dtype=np.float64)
+        if arr.size == 0 or arr.min() <= 0:
             raise ValueError("All prices must be positive")
         
-        # Calculate SMA using the most recent 'period' prices
-        recent_prices = prices[-period:]
-        sma = sum(recent_prices) / period
-        
-        logger.debug(f"SMA calculated: {sma:.5f} (period: {period})")
-        return sma
+        return arr
     
-    def calculate_technical_indicators(self, market_data: List[MarketData]) -> TechnicalIndicators:
+    def calculate_technical_indicators(
+        self, market_data: Union[List[MarketData], MarketDataBatch]
+    ) -> TechnicalIndicators:
         """
         Calculate all technical indicators from market data.
         
         Args:
-            market_data: List of market data (chronologically ordered, most recent last)
+            market_data: Market data records or batch (chronologically ordered, most recent last)
             
         Returns:
             TechnicalIndicators object with calculated values
@@ -156,30 +236,138 @@ class SignalProcessor:
         Raises:
             ValueError: If insufficient data
         """
-        if not market_data:
+        if len(market_data) == 0:
             raise ValueError("Market data cannot be empty")
         
-        # Extract closing prices
-        prices = [candle.close_price for candle in market_data]
+        # Convert to columns once; indicators only need closing prices
+        batch = self._as_batch(market_data)
+        prices = batch.close_price
         
         # Ensure we have enough data for both indicators
         min_required = max(self.rsi_period + 1, self.sma_period)
         if len(prices) < min_required:
             raise ValueError(f"Need at least {min_required} data points, got {len(prices)}")
         
+        # Repeat calls on the same candles (e.g. an unchanged tick) reuse the last result;
+        # the raw close bytes keep a revised candle from hitting a stale entry
+        key = (batch.timestamp[-1], self.rsi_period, self.sma_period, prices.tobytes())
+        cached = self._indicator_cache.get(batch.symbol)
+        if cached is not None and cached[0] == key:
+            # Copy so a caller mutating its result cannot alter the cached one
+            return replace(cached[1])
+        
         # Calculate indicators
-        rsi = self.calculate_rsi(prices)
-        sma = self.calculate_sma(prices)
-        current_price = prices[-1]
+        rsi, sma = self._rsi_sma_from_array(prices)
+        current_price = float(prices[-1])
         
-        return TechnicalIndicators(
+        indicators = TechnicalIndicators(
             rsi=rsi,
             sma=sma,
             current_price=current_price,
-            timestamp=market_data[-1].timestamp
+            timestamp=batch.latest_timestamp()
         )
+        self._indicator_cache[batch.symbol] = (key, replace(indicators))
+        return indicators
+    
+    def _rsi_sma_from_array(self, close: np.ndarray) -> Tuple[float, float]:
+        """
+        Calculate RSI and SMA together, validating the close prices once.
+        
+        Args:
+            close: Closing prices (most recent last), long enough for both periods
+            
+        Returns:
+            Tuple of (rsi, sma)
+        """
+        close = self._validate_indicator_prices(close)
+        
+        rsi = self._rsi_from_array(close, self.rsi_period)
+        sma = float(close[-self.sma_period:].mean())
+        
+        logger.debug(f"SMA calculated: {sma:.5f} (period: {self.sma_period})")
+        return rsi, sma
+    
+    def _validate_indicator_prices(self, close: Union[List[float], np.ndarray]) -> np.ndarray:
+        """Validate both indicator periods and the close prices; return them as float64."""
+        if self.rsi_period <= 0:
+            raise ValueError("RSI period must be positive")
+        if self.sma_period <= 0:
+            raise ValueError("SMA period must be positive")
+        
+        close = np.asarray(close, dtype=np.float64)
+        if close.size == 0 or close.min() <= 0:
+            raise ValueError("All prices must be positive")
+        
+        return close
+    
+    def seed_indicators(self, prices: List[float]) -> Tuple[float, float]:
+        """
+        Calculate RSI and SMA over a price history and keep state for streaming updates.
+        
+        Args:
+            prices: Closing prices (most recent last), long enough for both periods
+            
+        Returns:
+            Tuple of (rsi, sma) for the last price
+            
+        Raises:
+            ValueError: If insufficient data or invalid parameters
+        """
+        min_required = max(self.rsi_period + 1, self.sma_period)
+        if len(prices) < min_required:
+            raise ValueError(f"Need at least {min_required} data points, got {len(prices)}")
+        
+        close = self._validate_indicator_prices(prices)
+        
+        avg_gain, avg_loss = self._wilder_averages(close, self.rsi_period)
+        window = deque(close[-self.sma_period:].tolist(), maxlen=self.sma_period)
+        running_sum = float(sum(window))
+        self._rsi_state = (avg_gain, avg_loss, float(close[-1]))
+        self._sma_state = (running_sum, window)
+        
+        return self._rsi_from_averages(avg_gain, avg_loss), running_sum / self.sma_period
+    
+    def update_indicators(self, price: float) -> Tuple[float, float]:
+        """
+        Advance the seeded RSI and SMA by one closing price in O(1).
+        
+        Args:
+            price: Newest closing price
+            
+        Returns:
+            Tuple of (rsi, sma) including the new price
+            
+        Raises:
+            ValueError: If indicators have not been seeded or the price is not positive
+        """
+        if self._rsi_state is None or self._sma_state is None:
+            raise ValueError("Indicators must be seeded with seed_indicators() before updating")
+        if price <= 0:
+            raise ValueError("All prices must be positive")
+        
+        period = self.rsi_period
+        avg_gain, avg_loss, last_price = self._rsi_state
+        delta = price - last_price
+        avg_gain = (avg_gain * (period - 1) + max(delta, 0.0)) / period
+        avg_loss = (avg_loss * (period - 1) + max(-delta, 0.0)) / period
+        self._rsi_state = (avg_gain, avg_loss, price)
+        
+        # Rolling sum: drop the oldest price as the new one enters the window
+        running_sum, window = self._sma_state
+        running_sum += price - window[0]
+        window.append(price)
+        self._sma_state = (running_sum, window)
+        
+        return self._rsi_from_averages(avg_gain, avg_loss), running_sum / self.sma_period
     
-    def generate_signal(self, market_data: List[MarketData]) -> Optional[Signal]:
+    @staticmethod
+    def _as_batch(market_data: Union[List[MarketData], MarketDataBatch]) -> MarketDataBatch:
+        """Return market data as a columnar batch, converting records if needed."""
+        if isinstance(market_data, MarketDataBatch):
+            return market_data
+        return MarketDataBatch.from_records(market_data)
+    
+    def generate_signal(self, market_data: Union[List[MarketData], MarketDataBatch]) -> Optional[Signal]:
         """
         Generate trading signal based on RSI/SMA crossover strategy.
         
@@ -188,7 +376,7 @@ class SignalProcessor:
         - SELL (PUT): RSI > 70 (overbought) AND current_price < SMA (downtrend)
         
         Args:
-            market_data: List of market data (chronologically ordered, most recent last)
+            market_data: Market data records or batch (chronologically ordered, most recent last)
             
         Returns:
             Signal object if conditions are met, None otherwise
@@ -199,23 +387,19 @@ class SignalProcessor:
                 return None
             
             # Calculate technical indicators
-            indicators = self.calculate_technical_indicators(market_data)
+            batch = self._as_batch(market_data)
+            indicators = self.calculate_technical_indicators(batch)
             
-            symbol = market_data[-1].symbol
-            signal_type = None
+            symbol = batch.symbol
             
             # Apply signal generation rules
-            if (indicators.rsi < self.rsi_oversold_threshold and 
-                indicators.current_price > indicators.sma):
-                signal_type = SignalType.BUY
+            signal_type = self._decide_signal(indicators)
+            
+            if signal_type == SignalType.BUY:
                 logger.info(f"BUY signal generated for {symbol}: RSI={indicators.rsi:.2f}, Price={indicators.current_price:.5f} > SMA={indicators.sma:.5f}")
-                
-            elif (indicators.rsi > self.rsi_overbought_threshold and 
-                  indicators.current_price < indicators.sma):
-                signal_type = SignalType.SELL
+            elif signal_type == SignalType.SELL:
                 logger.info(f"SELL signal generated for {symbol}: RSI={indicators.rsi:.2f}, Price={indicators.current_price:.5f} < SMA={indicators.sma:.5f}")
-            
-            if signal_type is None:
+            else:
                 logger.debug(f"No signal generated for {symbol}: RSI={indicators.rsi:.2f}, Price={indicators.current_price:.5f}, SMA={indicators.sma:.5f}")
                 return None
             
@@ -239,6 +423,18 @@ class SignalProcessor:
             logger.error(f"Error generating signal: {str(e)}")
             return None
     
+    def _decide_signal(self, indicators: TechnicalIndicators) -> Optional[SignalType]:
+        """Apply the RSI/SMA crossover rules to already computed indicators."""
+        if (indicators.rsi < self.rsi_oversold_threshold and 
+            indicators.current_price > indicators.sma):
+            return SignalType.BUY
+        
+        if (indicators.rsi > self.rsi_overbought_threshold and 
+            indicators.current_price < indicators.sma):
+            return SignalType.SELL
+        
+        return None
+    
     def calculate_signal_confidence(self, indicators: TechnicalIndicators, signal_type: SignalType) -> float:
         """
         Calculate confidence score for a signal based on technical indicators.
@@ -381,16 +577,7 @@ class SignalProcessor:
         Returns:
             String description of signal strength
         """
-        if confidence >= 0.8:
-            return "Very Strong"
-        elif confidence >= 0.6:
-            return "Strong"
-        elif confidence >= 0.4:
-            return "Moderate"
-        elif confidence >= 0.2:
-            return "Weak"
-        else:
-            return "Very Weak"
+        return _STRENGTH_LABELS[bisect.bisect_right(_STRENGTH_BOUNDS, confidence)]
     
     def update_parameters(self, rsi_period: int = None, sma_period: int = None, 
                          rsi_oversold: int = None, rsi_overbought: int = None) -> None:
@@ -407,12 +594,16 @@ class SignalProcessor:
             if rsi_period <= 0:
                 raise ValueError("RSI period must be positive")
             self.rsi_period = rsi_period
+            self._rsi_state = None
+            self._indicator_cache.clear()
             logger.info(f"RSI period updated to {rsi_period}")
         
         if sma_period is not None:
             if sma_period <= 0:
                 raise ValueError("SMA period must be positive")
             self.sma_period = sma_period
+            self._sma_state = None
+            self._indicator_cache.clear()
             logger.info(f"SMA period updated to {sma_period}")
         
         if rsi_oversold is not None:
@@ -1,24 +1,82 @@
 """Utility functions for Pocket Option Trading Bot."""
 
 import logging
+import logging.handlers
+import math
+import os
 import sys
 from typing import Optional, Any, Union, List
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 import re
 
+import numpy as np
+
 from .config import get_config_manager
-from .models import MarketData, Signal, TradeRequest, ValidationResult
+from .models import MarketData, MarketDataBatch, Signal, TradeRequest, ValidationResult
+
+
+_UNSAFE_CHARS_RE = re.compile(r'[^a-zA-Z0-9\s\-_]')
+# The same unsafe set restricted to ASCII, for a regex-free bytes.translate path
+_UNSAFE_ASCII = bytes(c for c in range(128) if _UNSAFE_CHARS_RE.match(chr(c)))
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# Market data timestamps further ahead of the local clock than this get a warning
+_MAX_FUTURE_SKEW = timedelta(minutes=5)
+
+# Built once: a literal (int, float) would be rebuilt from globals on every call
+_NUMERIC_TYPES = (int, float)
+
+# Pairs of the major currencies (and their OTC variants), accepted by a single
+# hash lookup; any other symbol falls back to the format check
+_MAJOR_CURRENCIES = ("USD", "EUR", "GBP", "JPY", "AUD", "CAD", "CHF", "NZD")
+_MAJOR_PAIRS = frozenset(
+    base + quote + suffix
+    for base in _MAJOR_CURRENCIES
+    for quote in _MAJOR_CURRENCIES
+    if base != quote
+    for suffix in ("", "-OTC")
+)
+
+
+class _BufferedFileHandler(logging.handlers.MemoryHandler):
+    """Buffer records in memory and write them to a FileHandler in batches.
+
+    Flushes when the buffer fills, on WARNING or above, and on close; unlike
+    MemoryHandler, closing it also closes the target file.
+    """
+
+    def __init__(self, file_handler: logging.FileHandler, capacity: int = 1024):
+        super().__init__(capacity, flushLevel=logging.WARNING, target=file_handler)
+
+    def close(self) -> None:
+        file_handler = self.target
+        try:
+            super().close()
+        finally:
+            if file_handler is not None:
+                file_handler.close()
+
+
+def _file_target(handler: logging.Handler) -> Optional[logging.Handler]:
+    """Return the handler that writes the file: a buffer's target, or the handler itself."""
+    if isinstance(handler, _BufferedFileHandler):
+        return handler.target
+    return handler
 
 
 def setup_logging(
-    log_level: Optional[str] = None, log_file: Optional[str] = None
+    log_level: Optional[str] = None,
+    log_file: Optional[str] = None,
+    buffered: bool = False,
 ) -> logging.Logger:
     """Set up logging configuration for the application.
 
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
         log_file: Path to log file
+        buffered: Batch INFO/DEBUG file writes in memory (for test runs);
+            records still unwritten are lost if the process is killed
 
     Returns:
         Configured logger instance
@@ -42,18 +100,45 @@ def setup_logging(
     logger = logging.getLogger("trading_bot")
     logger.setLevel(getattr(logging, level.upper()))
 
-    # Remove existing handlers to avoid duplicates
-    logger.handlers.clear()
+    # Reuse handlers from an earlier call that already target the same
+    # stdout stream and log file; close and drop any others
+    file_name = os.path.abspath(file_path)
+    console_handler = next(
+        (
+            handler
+            for handler in logger.handlers
+            if type(handler) is logging.StreamHandler and handler.stream is sys.stdout
+        ),
+        None,
+    )
+    file_handler = next(
+        (
+            handler
+            for handler in logger.handlers
+            if isinstance(handler, _BufferedFileHandler) is buffered
+            and isinstance(_file_target(handler), logging.FileHandler)
+            and _file_target(handler).baseFilename == file_name
+        ),
+        None,
+    )
+    for handler in logger.handlers[:]:
+        if handler is not console_handler and handler is not file_handler:
+            handler.close()
+            logger.removeHandler(handler)
 
     # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
+    if console_handler is None:
+        console_handler = logging.StreamHandler(sys.stdout)
+        logger.addHandler(console_handler)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
 
-    # File handler
-    file_handler = logging.FileHandler(file_path)
-    file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+    # File handler, optionally buffered so INFO lines are written in batches
+    if file_handler is None:
+        file_handler = logging.FileHandler(file_path)
+        if buffered:
+            file_handler = _BufferedFileHandler(file_handler)
+        logger.addHandler(file_handler)
+    _file_target(file_handler).setFormatter(formatter)
 
     return logger
 
@@ -67,6 +152,9 @@ def validate_currency_pair(pair: str) -> bool:
     Returns:
         True if valid format, False otherwise
     """
+    if isinstance(pair, str) and pair in _MAJOR_PAIRS:
+        return True
+    
     if not pair or len(pair) < 6:
         return False
 
@@ -141,8 +229,6 @@ def validate_market_data(data: MarketData) -> ValidationResult:
     Returns:
         ValidationResult with validation status and any errors
     """
-    warnings = []
-    
     try:
         # Basic validation is handled by MarketData.__post_init__
         # Additional business logic validation
@@ -153,18 +239,25 @@ def validate_market_data(data: MarketData) -> ValidationResult:
                 error_message=f"Invalid currency pair format: {data.symbol}"
             )
         
-        # Check for reasonable price ranges (basic sanity check)
-        price_range = data.high_price - data.low_price
-        avg_price = (data.high_price + data.low_price) / 2
+        # MarketData.__post_init__ lets NaN/inf through (its comparisons are all False)
+        values = (data.open_price, data.high_price, data.low_price, data.close_price, data.volume)
+        if not all(map(math.isfinite, values)):
+            return ValidationResult(is_valid=False, error_message="Prices and volume must be finite")
+        
+        # A zero-priced candle is bad feed data (and has no average price)
+        high, low = data.high_price, data.low_price
+        if high + low <= 0:
+            return ValidationResult(is_valid=False, error_message="Prices must be positive")
         
-        if price_range / avg_price > 0.1:  # More than 10% range
+        warnings = []
+        
+        # Check for reasonable price ranges (basic sanity check)
+        if high - low > 0.05 * (high + low):  # More than 10% of the average price
             warnings.append("Unusually large price range detected")
         
-        # Check timestamp is not too far in future
-        if data.timestamp > datetime.now():
-            time_diff = (data.timestamp - datetime.now()).total_seconds()
-            if time_diff > 300:  # More than 5 minutes in future
-                warnings.append("Timestamp is significantly in the future")
+        # Check timestamp is not too far in future, with a single clock read
+        if data.timestamp - datetime.now() > _MAX_FUTURE_SKEW:
+            warnings.append("Timestamp is significantly in the future")
         
         return ValidationResult(is_valid=True, warnings=warnings)
         
@@ -172,6 +265,61 @@ def validate_market_data(data: MarketData) -> ValidationResult:
         return ValidationResult(is_valid=False, error_message=str(e))
 
 
+def validate_market_data_batch(batch: MarketDataBatch) -> ValidationResult:
+    """Validate a columnar batch of market data in one vectorized pass.
+    
+    Applies the MarketData field checks and the validate_market_data
+    rules, including its finite check, to every candle. The first failing
+    candle is reported.
+    
+    Args:
+        batch: MarketDataBatch to validate
+        
+    Returns:
+        ValidationResult with validation status and any errors
+    """
+    if len(batch) == 0:
+        return ValidationResult(is_valid=False, error_message="Market data cannot be empty")
+    
+    if not validate_currency_pair(batch.symbol):
+        return ValidationResult(
+            is_valid=False,
+            error_message=f"Invalid currency pair format: {batch.symbol}"
+        )
+    
+    opens, highs, lows, closes = batch.open_price, batch.high_price, batch.low_price, batch.close_price
+    prices = np.stack([opens, highs, lows, closes])
+    
+    # Field checks, in MarketData.__post_init__ order
+    checks = (
+        (~np.isfinite(prices).all(axis=0) | ~np.isfinite(batch.volume), "Prices and volume must be finite"),
+        ((prices < 0).any(axis=0), "Prices cannot be negative"),
+        (batch.volume < 0, "Volume cannot be negative"),
+        (highs < np.maximum(opens, closes), "High price cannot be less than open or close price"),
+        (lows > np.minimum(opens, closes), "Low price cannot be greater than open or close price"),
+        # Business rule from validate_market_data: zero-priced candles are bad feed data
+        (highs + lows <= 0, "Prices must be positive"),
+    )
+    for failed, message in checks:
+        if failed.any():
+            index = int(np.argmax(failed))
+            return ValidationResult(is_valid=False, error_message=f"{message} (candle {index})")
+    
+    warnings = []
+    
+    # Check for reasonable price ranges (basic sanity check); every average is positive here
+    range_ratio = (highs - lows) / ((highs + lows) / 2)
+    if (range_ratio > 0.1).any():  # More than 10% range
+        warnings.append("Unusually large price range detected")
+    
+    # Check timestamps are not too far in future (more than 5 minutes)
+    horizon = np.datetime64(datetime.now(), "us") + np.timedelta64(300, "s")
+    if (batch.timestamp > horizon).any():
+        warnings.append("Timestamp is significantly in the future")
+    
+    return ValidationResult(is_valid=True, warnings=warnings)
+
+
 def validate_signal(signal: Signal) -> ValidationResult:
     """Validate trading signal structure and values.
     
@@ -260,7 +408,8 @@ def is_numeric(value: Any) -> bool:
     Returns:
         True if numeric, False otherwise
     """
-    return isinstance(value, (int, float)) and not isinstance(value, bool)
+    # bool cannot be subclassed, so an exact type check excludes it
+    return isinstance(value, _NUMERIC_TYPES) and type(value) is not bool
 
 
 def is_positive_number(value: Any) -> bool:
@@ -313,7 +462,10 @@ def sanitize_string(value: str, max_length: int = 100) -> str:
         return ""
     
     # Remove special characters except alphanumeric, spaces, hyphens, underscores
-    sanitized = re.sub(r'[^a-zA-Z0-9\s\-_]', '', value)
+    if value.isascii():
+        sanitized = value.encode('ascii').translate(None, _UNSAFE_ASCII).decode('ascii')
+    else:
+        sanitized = _UNSAFE_CHARS_RE.sub('', value)
     
     # Limit length
     return sanitized[:max_length].strip()
@@ -363,8 +515,7 @@ def validate_email(email: str) -> bool:
     if not isinstance(email, str):
         return False
     
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    return _EMAIL_RE.match(email) is not None
 
 
 def validate_api_key(api_key: str, min_length: int = 10) -> bool:
@@ -0,0 +1,87 @@
+"""Shared pytest fixtures for the Pocket Option Trading Bot test suite."""
+
+from datetime import datetime
+
+import pytest
+
+from src.backend.database import DatabaseManager
+from src.backend.models import MarketData, Signal, SignalType, TradeDirection, TradeRequest
+
+
+# Instant the risk manager's clock is frozen at by ``frozen_clock``
+_FROZEN_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+
+class _FrozenDatetime(datetime):
+    """datetime subclass whose now() returns a settable frozen instant."""
+    
+    _now = _FROZEN_NOW
+    
+    @classmethod
+    def now(cls, tz=None):
+        return cls._now
+
+
+@pytest.fixture
+def frozen_clock(monkeypatch):
+    """Freeze datetime.now() inside the risk manager; tests may advance ``_now``.
+    
+    Modules opt in with ``pytestmark = pytest.mark.usefixtures("frozen_clock")``.
+    """
+    monkeypatch.setattr(_FrozenDatetime, "_now", _FROZEN_NOW)
+    monkeypatch.setattr("src.backend.risk_manager.datetime", _FrozenDatetime)
+    return _FrozenDatetime
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _db_smoke():
+    """Check once per session that DatabaseManager connections can run queries."""
+    db_manager = DatabaseManager(":memory:")
+    try:
+        with db_manager.get_connection() as conn:
+            assert conn.execute("SELECT 1").fetchone()[0] == 1
+    finally:
+        db_manager.close()
+
+
+# Valid model prototypes shared across the session. Tests must not mutate
+# them; derive variants with dataclasses.replace() instead.
+
+@pytest.fixture(scope="session")
+def base_market_data():
+    """Valid EURUSD candle."""
+    return MarketData(
+        symbol="EURUSD",
+        timestamp=datetime(2024, 1, 1),
+        open_price=1.1000,
+        high_price=1.1050,
+        low_price=1.0950,
+        close_price=1.1025,
+        volume=1000.0
+    )
+
+
+@pytest.fixture(scope="session")
+def base_signal():
+    """Valid high-confidence EURUSD BUY signal."""
+    return Signal(
+        symbol="EURUSD",
+        signal_type=SignalType.BUY,
+        confidence=0.85,
+        timestamp=datetime(2024, 1, 1),
+        rsi_value=25.0,
+        sma_value=1.1000,
+        current_price=1.1025
+    )
+
+
+@pytest.fixture(scope="session")
+def base_trade_request():
+    """Valid $10 EURUSD CALL demo trade request."""
+    return TradeRequest(
+        symbol="EURUSD",
+        direction=TradeDirection.CALL,
+        amount=10.0,
+        expiration_time=60,
+        is_demo=True
+    )
@@ -4,8 +4,6 @@ import pytest
 import asyncio
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch, AsyncMock
-import aiohttp
-import requests
 
 from src.backend.api_manager import (
     APIManager, CircuitBreaker, RateLimiter, CircuitBreakerState,
@@ -15,6 +13,32 @@ from src.backend.models import (
     MarketData, Signal, TradeRequest, TradeResult, Balance, 
     NotificationMessage, TradeDirection, SignalType
 )
+from src.backend import api_manager as api_manager_module
+
+
+async def _no_sleep(delay, result=None):
+    """asyncio.sleep stand-in that returns immediately."""
+    return result
+
+
+class _AsyncioWithoutSleep:
+    """Proxy for api_manager's ``asyncio`` reference with sleep replaced by a no-op."""
+    
+    sleep = staticmethod(_no_sleep)
+    
+    def __getattr__(self, name):
+        return getattr(asyncio, name)
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch, request):
+    """Skip simulated API latency unless marked ``real_sleep``.
+    
+    Only api_manager's own ``asyncio`` name is patched; the global
+    asyncio.sleep used by pytest-asyncio and other modules is untouched.
+    """
+    if "real_sleep" not in request.keywords:
+        monkeypatch.setattr(api_manager_module, "asyncio", _AsyncioWithoutSleep())
 
 
 class TestCircuitBreaker:
@@ -246,6 +270,7 @@ class TestAPIManager:
             await api_manager.get_market_data("EURUSD")
     
     @pytest.mark.asyncio
+    @pytest.mark.real_sleep
     async def test_rate_limiting_integration(self, api_manager):
         """Test rate limiting integration."""
         # Set very low rate limit for testing
@@ -1,31 +1,84 @@
 """Unit tests for database functionality."""
 
 import pytest
-import tempfile
-import os
+import sqlite3
 from datetime import datetime, date
 from pathlib import Path
 
 from src.backend.database import DatabaseManager
 from src.backend.models import TradeResult, TradeDirection
 
+# Fixed timestamp for trades whose age does not matter to the test
+_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+# Trade times and query window for the filter tests
+_T1 = datetime(2024, 1, 1, 10, 0, 0)
+_T2 = datetime(2024, 1, 2, 11, 0, 0)
+_T3 = datetime(2024, 1, 3, 12, 0, 0)
+_RANGE_START = datetime(2024, 1, 2, 0, 0, 0)
+_RANGE_END = datetime(2024, 1, 3, 23, 59, 59)
+_OLD_TIMESTAMP = datetime(2023, 1, 1, 10, 0, 0)
+
+_BASE_TRADE_KWARGS = dict(
+    trade_id="test_123",
+    symbol="EURUSD",
+    direction=TradeDirection.CALL,
+    amount=10.0,
+    entry_price=1.1000,
+    exit_price=1.1025,
+    profit_loss=8.5,
+    is_win=True,
+    timestamp=_NOW
+)
+
+# Overrides for the winning GBPUSD and losing EURUSD trades used in mixed sets
+_GBPUSD_WIN = dict(
+    symbol="GBPUSD",
+    direction=TradeDirection.PUT,
+    amount=15.0,
+    entry_price=1.2500,
+    exit_price=1.2475,
+    profit_loss=12.0
+)
+_EURUSD_LOSS = dict(
+    amount=20.0,
+    entry_price=1.1050,
+    exit_price=1.1040,
+    profit_loss=-20.0,
+    is_win=False
+)
+
+
+def _mk_trade(**overrides) -> TradeResult:
+    """Build a TradeResult from the base kwargs with selected fields overridden."""
+    return TradeResult(**dict(_BASE_TRADE_KWARGS, **overrides))
+
 
 class TestDatabaseManager:
     """Test cases for DatabaseManager."""
     
-    @pytest.fixture
-    def temp_db(self):
-        """Create temporary database for testing."""
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
-        temp_file.close()
+    @pytest.fixture(scope="class")
+    @classmethod
+    def temp_db(cls, request):
+        """Create in-memory database shared by all tests in the class.
         
-        db_manager = DatabaseManager(temp_file.name)
+        The URI is unique per collection node and never touches the
+        filesystem, so parallel pytest-xdist workers cannot collide.
+        """
+        uri = f"file:db_{id(request.node)}?mode=memory&cache=shared"
+        db_manager = DatabaseManager(uri, fast_mode=True, metrics_cache_ttl=60.0)
         
         yield db_manager
         
-        # Cleanup
-        if os.path.exists(temp_file.name):
-            os.unlink(temp_file.name)
+        db_manager.close()
+    
+    @pytest.fixture(autouse=True)
+    def _clean(self, temp_db):
+        """Empty all tables after each test so tests stay independent."""
+        yield
+        with temp_db.get_connection() as conn:
+            conn.executescript("DELETE FROM trades; DELETE FROM daily_performance;")
+        temp_db.invalidate_metrics_cache()
     
     def test_database_initialization(self, temp_db):
         """Test database schema initialization."""
@@ -43,17 +96,7 @@ class TestDatabaseManager:
     
     def test_save_trade(self, temp_db):
         """Test saving trade to database."""
-        trade = TradeResult(
-            trade_id="test_123",
-            symbol="EURUSD",
-            direction=TradeDirection.CALL,
-            amount=10.0,
-            entry_price=1.1000,
-            exit_price=1.1025,
-            profit_loss=8.5,
-            is_win=True,
-            timestamp=datetime.now()
-        )
+        trade = _mk_trade()
         
         result = temp_db.save_trade(trade)
         assert result is True
@@ -69,102 +112,103 @@ class TestDatabaseManager:
         """Test getting trades with various filters."""
         # Create test trades
         trades = [
-            TradeResult(
-                trade_id="trade_1",
-                symbol="EURUSD",
-                direction=TradeDirection.CALL,
-                amount=10.0,
-                entry_price=1.1000,
-                exit_price=1.1025,
-                profit_loss=8.5,
-                is_win=True,
-                timestamp=datetime(2024, 1, 1, 10, 0, 0)
-            ),
-            TradeResult(
-                trade_id="trade_2",
-                symbol="GBPUSD",
-                direction=TradeDirection.PUT,
-                amount=15.0,
-                entry_price=1.2500,
-                exit_price=1.2475,
-                profit_loss=12.0,
-                is_win=True,
-                timestamp=datetime(2024, 1, 2, 11, 0, 0)
-            ),
-            TradeResult(
-                trade_id="trade_3",
-                symbol="EURUSD",
-                direction=TradeDirection.CALL,
-                amount=20.0,
-                entry_price=1.1050,
-                exit_price=1.1040,
-                profit_loss=-20.0,
-                is_win=False,
-                timestamp=datetime(2024, 1, 3, 12, 0, 0)
-            )
+            _mk_trade(trade_id="trade_1", timestamp=_T1),
+            _mk_trade(trade_id="trade_2", timestamp=_T2, **_GBPUSD_WIN),
+            _mk_trade(trade_id="trade_3", timestamp=_T3, **_EURUSD_LOSS)
         ]
         
         # Save all trades
-        for trade in trades:
-            temp_db.save_trade(trade)
+        assert temp_db.save_trades_bulk(trades) is True
         
         # Test filter by symbol
         eurusd_trades = temp_db.get_trades(symbol="EURUSD")
         assert len(eurusd_trades) == 2
+        assert all(trade.symbol == "EURUSD" for trade in eurusd_trades)
         
         # Test filter by date range
-        start_date = datetime(2024, 1, 2, 0, 0, 0)
-        end_date = datetime(2024, 1, 3, 23, 59, 59)
-        date_filtered_trades = temp_db.get_trades(start_date=start_date, end_date=end_date)
-        assert len(date_filtered_trades) == 2
+        assert temp_db.count_trades(start_date=_RANGE_START, end_date=_RANGE_END) == 2
+        assert temp_db.count_trades(symbol="GBPUSD", start_date=_RANGE_START) == 1
         
         # Test limit
         limited_trades = temp_db.get_trades(limit=2)
         assert len(limited_trades) == 2
     
+    def test_get_trades_timestamp_predicate_first(self, temp_db):
+        """Test time-range predicates lead the WHERE clause."""
+        statements = []
+        with temp_db.get_connection() as conn:
+            conn.set_trace_callback(statements.append)
+            try:
+                temp_db.get_trades(symbol="EURUSD", start_date=_NOW, end_date=_NOW)
+            finally:
+                conn.set_trace_callback(None)
+        
+        query = next(sql for sql in statements if sql.startswith("SELECT * FROM trades"))
+        where_clause = query.split("WHERE", 1)[1].strip()
+        assert where_clause.startswith("timestamp >=")
+        assert where_clause.index("timestamp <=") < where_clause.index("symbol =")
+    
+    def test_trades_index_used(self, temp_db):
+        """Test symbol + time-range queries use the composite index."""
+        with temp_db.get_connection() as conn:
+            rows = conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM trades WHERE symbol = ? AND timestamp > ?",
+                ("EURUSD", _NOW)
+            ).fetchall()
+        
+        assert any("idx_trades_symbol_ts" in str(tuple(row)) for row in rows)
+    
+    def test_trades_use_date_partition(self, temp_db):
+        """Test day-based cleanup deletes through the trade_date index."""
+        with temp_db.get_connection() as conn:
+            rows = conn.execute(
+                "EXPLAIN QUERY PLAN DELETE FROM trades WHERE trade_date < date('now', '-90 days')"
+            ).fetchall()
+        
+        assert any("idx_trades_trade_date" in str(tuple(row)) for row in rows)
+    
+    def test_trade_date_added_to_legacy_schema(self, tmp_path):
+        """Test databases created without trade_date get the column on startup."""
+        db_file = tmp_path / "legacy.db"
+        conn = sqlite3.connect(db_file)
+        conn.execute("""
+            CREATE TABLE trades (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                trade_id TEXT UNIQUE NOT NULL,
+                symbol TEXT NOT NULL,
+                direction TEXT NOT NULL,
+                amount REAL NOT NULL,
+                entry_price REAL NOT NULL,
+                exit_price REAL,
+                profit_loss REAL,
+                is_win BOOLEAN,
+                timestamp DATETIME NOT NULL,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        conn.close()
+        
+        db_manager = DatabaseManager(str(db_file))
+        assert db_manager.save_trade(_mk_trade()) is True
+        with db_manager.get_connection() as conn:
+            row = conn.execute("SELECT trade_date FROM trades").fetchone()
+            # WAL set once at schema init persists for later connections
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert row['trade_date'] == "2024-01-01"
+    
     def test_update_daily_performance(self, temp_db):
         """Test updating daily performance metrics."""
         # Create test trades for today
         today = date.today()
+        today_start = datetime.combine(today, datetime.min.time())
         trades = [
-            TradeResult(
-                trade_id="daily_1",
-                symbol="EURUSD",
-                direction=TradeDirection.CALL,
-                amount=10.0,
-                entry_price=1.1000,
-                exit_price=1.1025,
-                profit_loss=8.5,
-                is_win=True,
-                timestamp=datetime.combine(today, datetime.min.time())
-            ),
-            TradeResult(
-                trade_id="daily_2",
-                symbol="GBPUSD",
-                direction=TradeDirection.PUT,
-                amount=15.0,
-                entry_price=1.2500,
-                exit_price=1.2475,
-                profit_loss=12.0,
-                is_win=True,
-                timestamp=datetime.combine(today, datetime.min.time())
-            ),
-            TradeResult(
-                trade_id="daily_3",
-                symbol="EURUSD",
-                direction=TradeDirection.CALL,
-                amount=20.0,
-                entry_price=1.1050,
-                exit_price=1.1040,
-                profit_loss=-20.0,
-                is_win=False,
-                timestamp=datetime.combine(today, datetime.min.time())
-            )
+            _mk_trade(trade_id="daily_1", timestamp=today_start),
+            _mk_trade(trade_id="daily_2", timestamp=today_start, **_GBPUSD_WIN),
+            _mk_trade(trade_id="daily_3", timestamp=today_start, **_EURUSD_LOSS)
         ]
         
         # Save trades
-        for trade in trades:
-            temp_db.save_trade(trade)
+        assert temp_db.save_trades_bulk(trades) is True
         
         # Update daily performance
         result = temp_db.update_daily_performance(today)
@@ -181,50 +225,20 @@ class TestDatabaseManager:
             assert row['winning_trades'] == 2
             assert row['losing_trades'] == 1
             assert row['total_profit_loss'] == 0.5  # 8.5 + 12.0 - 20.0
-            assert abs(row['win_rate'] - 66.67) < 0.1  # Approximately 66.67%
+            assert row['win_rate'] == pytest.approx(66.67, abs=0.1)
     
     def test_get_performance_metrics(self, temp_db):
         """Test getting performance metrics."""
-        # Create test trades
+        # Create test trades (must fall inside the rolling metrics window)
+        now = datetime.now()
         trades = [
-            TradeResult(
-                trade_id="perf_1",
-                symbol="EURUSD",
-                direction=TradeDirection.CALL,
-                amount=10.0,
-                entry_price=1.1000,
-                exit_price=1.1025,
-                profit_loss=8.5,
-                is_win=True,
-                timestamp=datetime.now()
-            ),
-            TradeResult(
-                trade_id="perf_2",
-                symbol="GBPUSD",
-                direction=TradeDirection.PUT,
-                amount=15.0,
-                entry_price=1.2500,
-                exit_price=1.2475,
-                profit_loss=12.0,
-                is_win=True,
-                timestamp=datetime.now()
-            ),
-            TradeResult(
-                trade_id="perf_3",
-                symbol="EURUSD",
-                direction=TradeDirection.CALL,
-                amount=20.0,
-                entry_price=1.1050,
-                exit_price=1.1040,
-                profit_loss=-20.0,
-                is_win=False,
-                timestamp=datetime.now()
-            )
+            _mk_trade(trade_id="perf_1", timestamp=now),
+            _mk_trade(trade_id="perf_2", timestamp=now, **_GBPUSD_WIN),
+            _mk_trade(trade_id="perf_3", timestamp=now, **_EURUSD_LOSS)
         ]
         
         # Save trades
-        for trade in trades:
-            temp_db.save_trade(trade)
+        assert temp_db.save_trades_bulk(trades) is True
         
         # Get performance metrics
         metrics = temp_db.get_performance_metrics(days=30)
@@ -232,46 +246,50 @@ class TestDatabaseManager:
         assert metrics.total_trades == 3
         assert metrics.winning_trades == 2
         assert metrics.losing_trades == 1
-        assert abs(metrics.win_rate - 66.67) < 0.1
+        assert metrics.win_rate == pytest.approx(66.67, abs=0.1)
         assert metrics.total_profit_loss == 0.5
         assert metrics.average_profit == 10.25  # (8.5 + 12.0) / 2
         assert metrics.average_loss == -20.0
+        
+        # Repeated calls reuse the cached result until trades change, as copies
+        # so a caller mutating its result cannot corrupt the cache
+        metrics.total_trades = 99
+        cached = temp_db.get_performance_metrics(days=30)
+        assert cached.total_trades == 3
+        assert cached is not temp_db.get_performance_metrics(days=30)
+        temp_db.save_trade(_mk_trade(trade_id="perf_4", timestamp=now))
+        assert temp_db.get_performance_metrics(days=30).total_trades == 4
+    
+    def test_get_performance_metrics_uncached_by_default(self):
+        """Test that a default manager sees writes made outside its own methods."""
+        db_manager = DatabaseManager(":memory:")
+        try:
+            assert db_manager.get_performance_metrics(days=30).total_trades == 0
+            with db_manager.get_connection() as conn:
+                conn.execute(
+                    "INSERT INTO trades (trade_id, symbol, direction, amount, entry_price, "
+                    "profit_loss, is_win, timestamp) VALUES ('raw_1', 'EURUSD', 'CALL', 10.0, "
+                    "1.1, 8.5, 1, ?)",
+                    (datetime.now(),)
+                )
+                conn.commit()
+            assert db_manager.get_performance_metrics(days=30).total_trades == 1
+        finally:
+            db_manager.close()
     
     def test_cleanup_old_data(self, temp_db):
         """Test cleaning up old data."""
-        # Create old trade (more than 90 days ago)
-        old_trade = TradeResult(
-            trade_id="old_trade",
-            symbol="EURUSD",
-            direction=TradeDirection.CALL,
-            amount=10.0,
-            entry_price=1.1000,
-            exit_price=1.1025,
-            profit_loss=8.5,
-            is_win=True,
-            timestamp=datetime(2023, 1, 1, 10, 0, 0)  # Old date
-        )
-        
-        # Create recent trade
-        recent_trade = TradeResult(
-            trade_id="recent_trade",
-            symbol="EURUSD",
-            direction=TradeDirection.CALL,
-            amount=10.0,
-            entry_price=1.1000,
-            exit_price=1.1025,
-            profit_loss=8.5,
-            is_win=True,
-            timestamp=datetime.now()
-        )
+        # Old trade (more than 90 days ago) and recent trade
+        trades = [
+            _mk_trade(trade_id="old_trade", timestamp=_OLD_TIMESTAMP),
+            _mk_trade(trade_id="recent_trade", timestamp=datetime.now()),
+        ]
         
-        # Save both trades
-        temp_db.save_trade(old_trade)
-        temp_db.save_trade(recent_trade)
+        # Save both trades in one executemany batch
+        assert temp_db.save_trades_bulk(trades) is True
         
         # Verify both trades exist
-        all_trades = temp_db.get_trades()
-        assert len(all_trades) == 2
+        assert temp_db.count_trades() == 2
         
         # Cleanup old data (keep last 90 days)
         result = temp_db.cleanup_old_data(days_to_keep=90)
@@ -286,26 +304,10 @@ class TestDatabaseManager:
         """Test database error handling."""
         # Test with invalid trade (this should be caught by model validation)
         with pytest.raises(ValueError):
-            invalid_trade = TradeResult(
-                trade_id="invalid",
-                symbol="EURUSD",
-                direction=TradeDirection.CALL,
-                amount=-10.0,  # Invalid negative amount
-                entry_price=1.1000,
-                exit_price=1.1025,
-                profit_loss=8.5,
-                is_win=True,
-                timestamp=datetime.now()
-            )
+            _mk_trade(trade_id="invalid", amount=-10.0)  # Invalid negative amount
     
-    def test_connection_context_manager(self, temp_db):
-        """Test database connection context manager."""
-        # Test successful connection
+    def test_fast_mode_pragmas(self, temp_db):
+        """Test fast mode connections skip fsync on commit."""
         with temp_db.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT 1")
-            result = cursor.fetchone()
-            assert result[0] == 1
-        
-        # Connection should be closed after context
-        # We can't directly test this, but the context manager should handle cleanup
\ No newline at end of file
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 0
+            assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2
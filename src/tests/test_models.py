@@ -1,28 +1,36 @@
 """Unit tests for data models."""
 
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta
 from src.backend.models import (
-    MarketData, Signal, TradeRequest, TradeResult, Balance,
+    MarketData, MarketDataBatch, Signal, TradeRequest, TradeResult, Balance,
     NotificationMessage, TradingStatus, PerformanceMetrics,
     ValidationResult, SignalType, TradeDirection
 )
 
+# Fixed timestamp shared by model builders; keeps tests deterministic
+_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
 
 class TestMarketData:
     """Test cases for MarketData model."""
     
-    def test_valid_market_data(self):
-        """Test creating valid market data."""
-        data = MarketData(
+    @pytest.fixture
+    def base_kwargs(self):
+        """Valid MarketData constructor arguments."""
+        return dict(
             symbol="EURUSD",
-            timestamp=datetime.now(),
+            timestamp=_NOW,
             open_price=1.1000,
             high_price=1.1050,
             low_price=1.0950,
             close_price=1.1025,
             volume=1000.0
         )
+    
+    def test_valid_market_data(self, base_kwargs):
+        """Test creating valid market data."""
+        data = MarketData(**base_kwargs)
         
         assert data.symbol == "EURUSD"
         assert data.open_price == 1.1000
@@ -31,73 +39,70 @@ class TestMarketData:
         assert data.close_price == 1.1025
         assert data.volume == 1000.0
     
-    def test_invalid_high_price(self):
-        """Test validation of high price."""
-        with pytest.raises(ValueError, match="High price cannot be less than"):
-            MarketData(
-                symbol="EURUSD",
-                timestamp=datetime.now(),
-                open_price=1.1000,
-                high_price=1.0900,  # Lower than open price
-                low_price=1.0950,
-                close_price=1.1025,
-                volume=1000.0
-            )
-    
-    def test_invalid_low_price(self):
-        """Test validation of low price."""
-        with pytest.raises(ValueError, match="Low price cannot be greater than"):
-            MarketData(
-                symbol="EURUSD",
-                timestamp=datetime.now(),
-                open_price=1.1000,
-                high_price=1.1050,
-                low_price=1.1100,  # Higher than open price
-                close_price=1.1025,
-                volume=1000.0
-            )
+    @pytest.mark.parametrize("field,value,match", [
+        ("high_price", 1.0900, "High price cannot be less than"),  # Lower than open price
+        ("low_price", 1.1100, "Low price cannot be greater than"),  # Higher than open price
+        ("open_price", -1.1000, "Prices cannot be negative"),
+        ("volume", -1000.0, "Volume cannot be negative"),
+    ])
+    def test_invalid_field(self, base_kwargs, field, value, match):
+        """Test validation of invalid market data fields."""
+        base_kwargs[field] = value
+        with pytest.raises(ValueError, match=match):
+            MarketData(**base_kwargs)
+
+
+class TestMarketDataBatch:
+    """Test cases for MarketDataBatch model."""
     
-    def test_negative_prices(self):
-        """Test validation of negative prices."""
-        with pytest.raises(ValueError, match="Prices cannot be negative"):
+    def test_from_records(self):
+        """Test converting MarketData records into columns."""
+        records = [
             MarketData(
                 symbol="EURUSD",
-                timestamp=datetime.now(),
-                open_price=-1.1000,
-                high_price=1.1050,
-                low_price=1.0950,
-                close_price=1.1025,
-                volume=1000.0
+                timestamp=_NOW + timedelta(minutes=i),
+                open_price=1.1000 + i * 0.001,
+                high_price=1.1050 + i * 0.001,
+                low_price=1.0950 + i * 0.001,
+                close_price=1.1025 + i * 0.001,
+                volume=1000.0 + i
             )
+            for i in range(3)
+        ]
+        
+        batch = MarketDataBatch.from_records(records)
+        
+        assert len(batch) == 3
+        assert batch.symbol == "EURUSD"
+        assert batch.close_price.tolist() == [record.close_price for record in records]
+        assert batch.volume.tolist() == [1000.0, 1001.0, 1002.0]
+        assert batch.latest_timestamp() == _NOW + timedelta(minutes=2)
     
-    def test_negative_volume(self):
-        """Test validation of negative volume."""
-        with pytest.raises(ValueError, match="Volume cannot be negative"):
-            MarketData(
-                symbol="EURUSD",
-                timestamp=datetime.now(),
-                open_price=1.1000,
-                high_price=1.1050,
-                low_price=1.0950,
-                close_price=1.1025,
-                volume=-1000.0
-            )
+    def test_from_records_empty(self):
+        """Test that an empty record list is rejected."""
+        with pytest.raises(ValueError, match="Market data cannot be empty"):
+            MarketDataBatch.from_records([])
 
 
 class TestSignal:
     """Test cases for Signal model."""
     
-    def test_valid_signal(self):
-        """Test creating valid signal."""
-        signal = Signal(
+    @pytest.fixture
+    def base_kwargs(self):
+        """Valid Signal constructor arguments."""
+        return dict(
             symbol="EURUSD",
             signal_type=SignalType.BUY,
             confidence=0.85,
-            timestamp=datetime.now(),
+            timestamp=_NOW,
             rsi_value=25.0,
             sma_value=1.1000,
             current_price=1.1025
         )
+    
+    def test_valid_signal(self, base_kwargs):
+        """Test creating valid signal."""
+        signal = Signal(**base_kwargs)
         
         assert signal.symbol == "EURUSD"
         assert signal.signal_type == SignalType.BUY
@@ -106,58 +111,35 @@ class TestSignal:
         assert signal.sma_value == 1.1000
         assert signal.current_price == 1.1025
     
-    def test_invalid_confidence(self):
-        """Test validation of confidence value."""
-        with pytest.raises(ValueError, match="Confidence must be between 0 and 1"):
-            Signal(
-                symbol="EURUSD",
-                signal_type=SignalType.BUY,
-                confidence=1.5,  # Invalid confidence
-                timestamp=datetime.now(),
-                rsi_value=25.0,
-                sma_value=1.1000,
-                current_price=1.1025
-            )
-    
-    def test_invalid_rsi(self):
-        """Test validation of RSI value."""
-        with pytest.raises(ValueError, match="RSI value must be between 0 and 100"):
-            Signal(
-                symbol="EURUSD",
-                signal_type=SignalType.BUY,
-                confidence=0.85,
-                timestamp=datetime.now(),
-                rsi_value=150.0,  # Invalid RSI
-                sma_value=1.1000,
-                current_price=1.1025
-            )
-    
-    def test_negative_sma(self):
-        """Test validation of negative SMA."""
-        with pytest.raises(ValueError, match="SMA value cannot be negative"):
-            Signal(
-                symbol="EURUSD",
-                signal_type=SignalType.BUY,
-                confidence=0.85,
-                timestamp=datetime.now(),
-                rsi_value=25.0,
-                sma_value=-1.1000,  # Negative SMA
-                current_price=1.1025
-            )
+    @pytest.mark.parametrize("field,value,match", [
+        ("confidence", 1.5, "Confidence must be between 0 and 1"),
+        ("rsi_value", 150.0, "RSI value must be between 0 and 100"),
+        ("sma_value", -1.1000, "SMA value cannot be negative"),
+    ])
+    def test_invalid_field(self, base_kwargs, field, value, match):
+        """Test validation of invalid signal fields."""
+        base_kwargs[field] = value
+        with pytest.raises(ValueError, match=match):
+            Signal(**base_kwargs)
 
 
 class TestTradeRequest:
     """Test cases for TradeRequest model."""
     
-    def test_valid_trade_request(self):
-        """Test creating valid trade request."""
-        request = TradeRequest(
+    @pytest.fixture
+    def base_kwargs(self):
+        """Valid TradeRequest constructor arguments."""
+        return dict(
             symbol="EURUSD",
             direction=TradeDirection.CALL,
             amount=10.0,
             expiration_time=60,
             is_demo=True
         )
+    
+    def test_valid_trade_request(self, base_kwargs):
+        """Test creating valid trade request."""
+        request = TradeRequest(**base_kwargs)
         
         assert request.symbol == "EURUSD"
         assert request.direction == TradeDirection.CALL
@@ -165,35 +147,24 @@ class TestTradeRequest:
         assert request.expiration_time == 60
         assert request.is_demo is True
     
-    def test_invalid_amount(self):
-        """Test validation of trade amount."""
-        with pytest.raises(ValueError, match="Trade amount must be positive"):
-            TradeRequest(
-                symbol="EURUSD",
-                direction=TradeDirection.CALL,
-                amount=-10.0,  # Negative amount
-                expiration_time=60,
-                is_demo=True
-            )
-    
-    def test_invalid_expiration_time(self):
-        """Test validation of expiration time."""
-        with pytest.raises(ValueError, match="Expiration time must be positive"):
-            TradeRequest(
-                symbol="EURUSD",
-                direction=TradeDirection.CALL,
-                amount=10.0,
-                expiration_time=-60,  # Negative expiration
-                is_demo=True
-            )
+    @pytest.mark.parametrize("field,value,match", [
+        ("amount", -10.0, "Trade amount must be positive"),
+        ("expiration_time", -60, "Expiration time must be positive"),
+    ])
+    def test_invalid_field(self, base_kwargs, field, value, match):
+        """Test validation of invalid trade request fields."""
+        base_kwargs[field] = value
+        with pytest.raises(ValueError, match=match):
+            TradeRequest(**base_kwargs)
 
 
 class TestTradeResult:
     """Test cases for TradeResult model."""
     
-    def test_valid_trade_result(self):
-        """Test creating valid trade result."""
-        result = TradeResult(
+    @pytest.fixture
+    def base_kwargs(self):
+        """Valid TradeResult constructor arguments."""
+        return dict(
             trade_id="12345",
             symbol="EURUSD",
             direction=TradeDirection.CALL,
@@ -202,8 +173,12 @@ class TestTradeResult:
             exit_price=1.1025,
             profit_loss=8.5,
             is_win=True,
-            timestamp=datetime.now()
+            timestamp=_NOW
         )
+    
+    def test_valid_trade_result(self, base_kwargs):
+        """Test creating valid trade result."""
+        result = TradeResult(**base_kwargs)
         
         assert result.trade_id == "12345"
         assert result.symbol == "EURUSD"
@@ -214,72 +189,47 @@ class TestTradeResult:
         assert result.profit_loss == 8.5
         assert result.is_win is True
     
-    def test_invalid_amount(self):
-        """Test validation of trade amount."""
-        with pytest.raises(ValueError, match="Trade amount must be positive"):
-            TradeResult(
-                trade_id="12345",
-                symbol="EURUSD",
-                direction=TradeDirection.CALL,
-                amount=-10.0,  # Negative amount
-                entry_price=1.1000,
-                exit_price=1.1025,
-                profit_loss=8.5,
-                is_win=True,
-                timestamp=datetime.now()
-            )
-    
-    def test_negative_entry_price(self):
-        """Test validation of entry price."""
-        with pytest.raises(ValueError, match="Entry price cannot be negative"):
-            TradeResult(
-                trade_id="12345",
-                symbol="EURUSD",
-                direction=TradeDirection.CALL,
-                amount=10.0,
-                entry_price=-1.1000,  # Negative entry price
-                exit_price=1.1025,
-                profit_loss=8.5,
-                is_win=True,
-                timestamp=datetime.now()
-            )
+    @pytest.mark.parametrize("field,value,match", [
+        ("amount", -10.0, "Trade amount must be positive"),
+        ("entry_price", -1.1000, "Entry price cannot be negative"),
+    ])
+    def test_invalid_field(self, base_kwargs, field, value, match):
+        """Test validation of invalid trade result fields."""
+        base_kwargs[field] = value
+        with pytest.raises(ValueError, match=match):
+            TradeResult(**base_kwargs)
 
 
 class TestBalance:
     """Test cases for Balance model."""
     
-    def test_valid_balance(self):
-        """Test creating valid balance."""
-        balance = Balance(
+    @pytest.fixture
+    def base_kwargs(self):
+        """Valid Balance constructor arguments."""
+        return dict(
             total_balance=1000.0,
             available_balance=950.0,
             currency="USD",
-            timestamp=datetime.now()
+            timestamp=_NOW
         )
+    
+    def test_valid_balance(self, base_kwargs):
+        """Test creating valid balance."""
+        balance = Balance(**base_kwargs)
         
         assert balance.total_balance == 1000.0
         assert balance.available_balance == 950.0
         assert balance.currency == "USD"
     
-    def test_negative_total_balance(self):
-        """Test validation of negative total balance."""
-        with pytest.raises(ValueError, match="Total balance cannot be negative"):
-            Balance(
-                total_balance=-1000.0,
-                available_balance=950.0,
-                currency="USD",
-                timestamp=datetime.now()
-            )
-    
-    def test_available_exceeds_total(self):
-        """Test validation when available balance exceeds total."""
-        with pytest.raises(ValueError, match="Available balance cannot exceed total balance"):
-            Balance(
-                total_balance=1000.0,
-                available_balance=1100.0,  # Exceeds total
-                currency="USD",
-                timestamp=datetime.now()
-            )
+    @pytest.mark.parametrize("field,value,match", [
+        ("total_balance", -1000.0, "Total balance cannot be negative"),
+        ("available_balance", 1100.0, "Available balance cannot exceed total balance"),
+    ])
+    def test_invalid_field(self, base_kwargs, field, value, match):
+        """Test validation of invalid balance fields."""
+        base_kwargs[field] = value
+        with pytest.raises(ValueError, match=match):
+            Balance(**base_kwargs)
 
 
 class TestNotificationMessage:
@@ -291,7 +241,7 @@ class TestNotificationMessage:
             message_type="trade_executed",
             title="Trade Executed",
             content="EURUSD CALL trade executed successfully",
-            timestamp=datetime.now(),
+            timestamp=_NOW,
             priority="high"
         )
         
@@ -306,7 +256,7 @@ class TestNotificationMessage:
                 message_type="trade_executed",
                 title="Trade Executed",
                 content="EURUSD CALL trade executed successfully",
-                timestamp=datetime.now(),
+                timestamp=_NOW,
                 priority="invalid"  # Invalid priority
             )
 
@@ -314,18 +264,23 @@ class TestNotificationMessage:
 class TestTradingStatus:
     """Test cases for TradingStatus model."""
     
-    def test_valid_trading_status(self):
-        """Test creating valid trading status."""
-        status = TradingStatus(
+    @pytest.fixture
+    def base_kwargs(self):
+        """Valid TradingStatus constructor arguments."""
+        return dict(
             is_active=True,
             current_pairs=["EURUSD", "GBPUSD"],
-            last_signal_time=datetime.now(),
-            last_trade_time=datetime.now(),
+            last_signal_time=_NOW,
+            last_trade_time=_NOW,
             total_trades_today=10,
             wins_today=7,
             losses_today=3,
             profit_loss_today=25.5
         )
+    
+    def test_valid_trading_status(self, base_kwargs):
+        """Test creating valid trading status."""
+        status = TradingStatus(**base_kwargs)
         
         assert status.is_active is True
         assert len(status.current_pairs) == 2
@@ -333,27 +288,25 @@ class TestTradingStatus:
         assert status.wins_today == 7
         assert status.losses_today == 3
     
-    def test_wins_losses_exceed_total(self):
-        """Test validation when wins + losses exceed total trades."""
-        with pytest.raises(ValueError, match="Wins \\+ losses cannot exceed total trades"):
-            TradingStatus(
-                is_active=True,
-                current_pairs=["EURUSD"],
-                last_signal_time=None,
-                last_trade_time=None,
-                total_trades_today=10,
-                wins_today=7,
-                losses_today=5,  # 7 + 5 > 10
-                profit_loss_today=25.5
-            )
+    @pytest.mark.parametrize("field,value,match", [
+        ("losses_today", 5, "Wins \\+ losses cannot exceed total trades"),  # 7 + 5 > 10
+        ("total_trades_today", -1, "Total trades cannot be negative"),
+        ("wins_today", -1, "Wins cannot be negative"),
+    ])
+    def test_invalid_field(self, base_kwargs, field, value, match):
+        """Test validation of invalid trading status fields."""
+        base_kwargs[field] = value
+        with pytest.raises(ValueError, match=match):
+            TradingStatus(**base_kwargs)
 
 
 class TestPerformanceMetrics:
     """Test cases for PerformanceMetrics model."""
     
-    def test_valid_performance_metrics(self):
-        """Test creating valid performance metrics."""
-        metrics = PerformanceMetrics(
+    @pytest.fixture
+    def base_kwargs(self):
+        """Valid PerformanceMetrics constructor arguments."""
+        return dict(
             total_trades=100,
             winning_trades=75,
             losing_trades=25,
@@ -364,41 +317,25 @@ class TestPerformanceMetrics:
             max_consecutive_wins=5,
             max_consecutive_losses=3
         )
+    
+    def test_valid_performance_metrics(self, base_kwargs):
+        """Test creating valid performance metrics."""
+        metrics = PerformanceMetrics(**base_kwargs)
         
         assert metrics.total_trades == 100
         assert metrics.winning_trades == 75
         assert metrics.losing_trades == 25
         assert metrics.win_rate == 75.0
     
-    def test_invalid_win_rate(self):
-        """Test validation of win rate."""
-        with pytest.raises(ValueError, match="Win rate must be between 0 and 100"):
-            PerformanceMetrics(
-                total_trades=100,
-                winning_trades=75,
-                losing_trades=25,
-                win_rate=150.0,  # Invalid win rate
-                total_profit_loss=250.0,
-                average_profit=15.0,
-                average_loss=-8.0,
-                max_consecutive_wins=5,
-                max_consecutive_losses=3
-            )
-    
-    def test_trades_mismatch(self):
-        """Test validation when winning + losing trades don't match total."""
-        with pytest.raises(ValueError, match="Winning \\+ losing trades must equal total trades"):
-            PerformanceMetrics(
-                total_trades=100,
-                winning_trades=75,
-                losing_trades=30,  # 75 + 30 != 100
-                win_rate=75.0,
-                total_profit_loss=250.0,
-                average_profit=15.0,
-                average_loss=-8.0,
-                max_consecutive_wins=5,
-                max_consecutive_losses=3
-            )
+    @pytest.mark.parametrize("field,value,match", [
+        ("win_rate", 150.0, "Win rate must be between 0 and 100"),
+        ("losing_trades", 30, "Winning \\+ losing trades must equal total trades"),  # 75 + 30 != 100
+    ])
+    def test_invalid_field(self, base_kwargs, field, value, match):
+        """Test validation of invalid performance metrics fields."""
+        base_kwargs[field] = value
+        with pytest.raises(ValueError, match=match):
+            PerformanceMetrics(**base_kwargs)
 
 
 class TestValidationResult:
@@ -425,4 +362,4 @@ class TestValidationResult:
         
         assert result.is_valid is False
         assert result.error_message == "Validation failed"
-        assert result.warnings == []  # Should be initialized to empty list
\ No newline at end of file
+        assert result.warnings == []  # Should be initialized to empty list
@@ -0,0 +1,44 @@
+"""Benchmarks for the hot validation paths.
+
+Run on their own with ``pytest src/tests/test_perf.py -n 0 --no-cov
+--benchmark-only``. RiskManager's hot paths live in test_risk_manager_perf.py
+under the ``risk_manager`` group. Save a baseline with ``--benchmark-autosave``
+and gate changes with ``--benchmark-compare --benchmark-compare-fail=median:10%``.
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from src.backend.utils import (
+    validate_market_data,
+    validate_signal,
+    validate_trade_request
+)
+
+
+# GC pauses land inside sub-microsecond rounds and swamp the timings
+pytestmark = pytest.mark.benchmark(group="validators", disable_gc=True, warmup=True)
+
+# The utils validators run in about a microsecond; batch iterations so
+# timer overhead does not dominate each round
+_PEDANTIC = dict(rounds=100, warmup_rounds=5, iterations=50)
+
+
+def test_validate_market_data_perf(benchmark, base_market_data):
+    """Time validate_market_data on a valid candle."""
+    result = benchmark.pedantic(validate_market_data, args=(base_market_data,), **_PEDANTIC)
+    assert result.is_valid
+
+
+def test_validate_signal_perf(benchmark, base_signal):
+    """Time validate_signal on a valid signal."""
+    result = benchmark.pedantic(validate_signal, args=(base_signal,), **_PEDANTIC)
+    assert result.is_valid
+
+
+def test_validate_trade_request_perf(benchmark, base_trade_request):
+    """Time validate_trade_request on a valid trade request."""
+    result = benchmark.pedantic(validate_trade_request, args=(base_trade_request,), **_PEDANTIC)
+    assert result.is_valid
+
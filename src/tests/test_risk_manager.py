@@ -1,23 +1,73 @@
 """Unit tests for Risk Manager."""
 
+import dataclasses
+
 import pytest
 from datetime import datetime, timedelta
-from unittest.mock import Mock
 
+from src.backend import risk_manager as risk_manager_module
 from src.backend.risk_manager import RiskManager, RiskMetrics
 from src.backend.models import (
     TradeRequest, 
     TradeResult, 
     Balance, 
     TradeDirection,
-    ValidationResult
+    ValidationResult,
+    ErrorCode
 )
 from src.backend.config import TradingConfig
 
 
-@pytest.fixture
+# Every test runs against the conftest frozen clock
+pytestmark = pytest.mark.usefixtures("frozen_clock")
+
+
+def _now():
+    """The risk manager's current time, frozen by ``frozen_clock``."""
+    return risk_manager_module.datetime.now()
+
+
+# (is_win, exit_price, profit_loss) for a standard winning and losing trade
+_WIN = (True, 1.1010, 8.0)
+_LOSS = (False, 1.0990, -10.0)
+
+# Shared by the single-record and batch recording tests
+_RECORD_CASES = pytest.mark.parametrize("trade_case,count,expected_pause", [
+    (_WIN, 1, False),
+    (_LOSS, 1, False),
+    (_LOSS, 3, True),  # Consecutive losses reach the limit
+], ids=["win", "loss", "consecutive_losses"])
+
+
+# Winning EURUSD CALL trade; tests derive variants via replace()
+_PROTO_TRADE = TradeResult(
+    trade_id="test_000",
+    symbol="EURUSD",
+    direction=TradeDirection.CALL,
+    amount=10.0,
+    entry_price=1.1000,
+    exit_price=1.1010,
+    profit_loss=8.0,
+    is_win=True,
+    timestamp=datetime(2024, 1, 1)
+)
+
+
+def _make_trade(idx, is_win, exit_px, pnl):
+    """Build a trade result from the prototype with the given outcome, stamped now."""
+    return dataclasses.replace(
+        _PROTO_TRADE,
+        trade_id=f"test_{idx:03d}",
+        exit_price=exit_px,
+        profit_loss=pnl,
+        is_win=is_win,
+        timestamp=_now()
+    )
+
+
+@pytest.fixture(scope="module")
 def trading_config():
-    """Create a test trading configuration."""
+    """Create a test trading configuration (read-only, shared per module)."""
     return TradingConfig(
         default_trade_amount=10.0,
         max_daily_loss_percent=5.0,
@@ -33,18 +83,18 @@ def risk_manager(trading_config):
     return RiskManager(trading_config)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_balance():
     """Create a sample balance for testing."""
     return Balance(
         total_balance=1000.0,
         available_balance=1000.0,
         currency="USD",
-        timestamp=datetime.now()
+        timestamp=datetime(2024, 1, 1)
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_trade_request():
     """Create a sample trade request for testing."""
     return TradeRequest(
@@ -108,36 +158,25 @@ class TestRiskManager:
         
         assert result.is_valid
         assert result.error_message is None
-    
-    def test_validate_trade_request_insufficient_balance(self, risk_manager, sample_balance):
-        """Test validation with insufficient balance."""
-        trade_request = TradeRequest(
-            symbol="EURUSD",
-            direction=TradeDirection.CALL,
-            amount=1500.0,  # More than available balance
-            expiration_time=60,
-            is_demo=True
-        )
+        assert result.error_code is None
+    
+    @pytest.mark.parametrize("amount,is_demo,paused,expected_code", [
+        (1500.0, True, False, ErrorCode.INSUFFICIENT_BALANCE),  # More than available balance
+        (50.0, True, False, ErrorCode.EXCEEDS_MAX_TRADE_PERCENT),  # 5% of balance, exceeds 2% limit
+        (10.0, False, False, ErrorCode.DEMO_MODE_VIOLATION),  # Real trade in demo mode
+        (20.0, True, True, ErrorCode.TRADING_PAUSED),
+    ], ids=["insufficient_balance", "exceeds_max_trade_percent", "demo_mode_violation", "paused"])
+    def test_validate_trade_request_failures(self, risk_manager, sample_trade_request, sample_balance,
+                                             amount, is_demo, paused, expected_code):
+        """Test each reason a trade request can fail validation."""
+        trade_request = dataclasses.replace(sample_trade_request, amount=amount, is_demo=is_demo)
+        if paused:
+            risk_manager._pause_trading("Test pause")
         
         result = risk_manager.validate_trade_request(trade_request, sample_balance)
         
         assert not result.is_valid
-        assert "Insufficient balance" in result.error_message
-    
-    def test_validate_trade_request_exceeds_max_trade_percent(self, risk_manager, sample_balance):
-        """Test validation when trade amount exceeds maximum percentage."""
-        trade_request = TradeRequest(
-            symbol="EURUSD",
-            direction=TradeDirection.CALL,
-            amount=50.0,  # 5% of balance, exceeds 2% limit
-            expiration_time=60,
-            is_demo=True
-        )
-        
-        result = risk_manager.validate_trade_request(trade_request, sample_balance)
-        
-        assert not result.is_valid
-        assert "exceeds maximum allowed" in result.error_message
+        assert result.error_code is expected_code
     
     def test_validate_trade_request_negative_amount(self, risk_manager, sample_balance):
         """Test validation with negative trade amount."""
@@ -146,22 +185,7 @@ class TestRiskManager:
         validation_result = risk_manager._validate_trade_amount(-10.0, sample_balance.available_balance)
         
         assert not validation_result.is_valid
-        assert "must be positive" in validation_result.error_message
-    
-    def test_validate_trade_request_demo_mode_violation(self, risk_manager, sample_balance):
-        """Test validation when trying real trade in demo mode."""
-        trade_request = TradeRequest(
-            symbol="EURUSD",
-            direction=TradeDirection.CALL,
-            amount=10.0,
-            expiration_time=60,
-            is_demo=False  # Real trade in demo mode
-        )
-        
-        result = risk_manager.validate_trade_request(trade_request, sample_balance)
-        
-        assert not result.is_valid
-        assert "demo mode" in result.error_message
+        assert validation_result.error_code is ErrorCode.NON_POSITIVE_AMOUNT
     
     def test_check_daily_limits_within_limits(self, risk_manager):
         """Test daily limits check when within limits."""
@@ -208,64 +232,46 @@ class TestRiskManager:
         assert result is False
         assert not risk_manager.is_paused
     
-    def test_record_trade_result_win(self, risk_manager):
-        """Test recording a winning trade result."""
-        trade_result = TradeResult(
-            trade_id="test_001",
-            symbol="EURUSD",
-            direction=TradeDirection.CALL,
-            amount=10.0,
-            entry_price=1.1000,
-            exit_price=1.1010,
-            profit_loss=8.0,
-            is_win=True,
-            timestamp=datetime.now()
-        )
+    @_RECORD_CASES
+    def test_record_trade_result(self, risk_manager, trade_case, count, expected_pause):
+        """Test recording trade results one at a time and the consecutive-loss pause."""
+        trades = [_make_trade(i, *trade_case) for i in range(count)]
+        for trade_result in trades:
+            risk_manager.record_trade_result(trade_result)
         
-        risk_manager.record_trade_result(trade_result)
+        assert risk_manager.trade_history == trades
+        assert risk_manager.is_paused is expected_pause
+        if expected_pause:
+            assert "Consecutive loss limit reached" in risk_manager.pause_reason
+    
+    @_RECORD_CASES
+    def test_record_trade_results(self, risk_manager, trade_case, count, expected_pause):
+        """Test recording a batch of trade results and the consecutive-loss pause."""
+        trades = [_make_trade(i, *trade_case) for i in range(count)]
+        risk_manager.record_trade_results(trades)
         
-        assert len(risk_manager.trade_history) == 1
-        assert risk_manager.trade_history[0] == trade_result
-        assert not risk_manager.is_paused
+        assert risk_manager.trade_history == trades
+        assert risk_manager.is_paused is expected_pause
+        if expected_pause:
+            assert "Consecutive loss limit reached" in risk_manager.pause_reason
     
-    def test_record_trade_result_loss(self, risk_manager):
-        """Test recording a losing trade result."""
-        trade_result = TradeResult(
-            trade_id="test_001",
-            symbol="EURUSD",
-            direction=TradeDirection.CALL,
-            amount=10.0,
-            entry_price=1.1000,
-            exit_price=1.0990,
-            profit_loss=-10.0,
-            is_win=False,
-            timestamp=datetime.now()
-        )
+    def test_record_trade_results_matches_single_records(self, trading_config):
+        """Test batch recording ends in the same state as one-by-one recording."""
+        # Streak reaches the limit mid-batch, then a win resets it
+        sequence = [_LOSS, _LOSS, _LOSS, _WIN]
+        trades = [_make_trade(i, *trade_case) for i, trade_case in enumerate(sequence)]
         
-        risk_manager.record_trade_result(trade_result)
+        batch = RiskManager(trading_config)
+        batch.record_trade_results(trades)
         
-        assert len(risk_manager.trade_history) == 1
-        assert risk_manager.trade_history[0] == trade_result
-    
-    def test_record_consecutive_losses_triggers_pause(self, risk_manager):
-        """Test that consecutive losses trigger trading pause."""
-        # Record 3 consecutive losses
-        for i in range(3):
-            trade_result = TradeResult(
-                trade_id=f"test_{i:03d}",
-                symbol="EURUSD",
-                direction=TradeDirection.CALL,
-                amount=10.0,
-                entry_price=1.1000,
-                exit_price=1.0990,
-                profit_loss=-10.0,
-                is_win=False,
-                timestamp=datetime.now()
-            )
-            risk_manager.record_trade_result(trade_result)
+        single = RiskManager(trading_config)
+        for trade_result in trades:
+            single.record_trade_result(trade_result)
         
-        assert risk_manager.is_paused
-        assert "Consecutive loss limit reached" in risk_manager.pause_reason
+        assert batch.trade_history == single.trade_history
+        assert batch.is_paused and single.is_paused
+        assert batch.pause_reason == single.pause_reason
+        assert batch.pause_until == single.pause_until
     
     def test_get_risk_metrics(self, risk_manager):
         """Test getting current risk metrics."""
@@ -273,18 +279,7 @@ class TestRiskManager:
         current_balance = 950.0
         
         # Add some trade history
-        trade_result = TradeResult(
-            trade_id="test_001",
-            symbol="EURUSD",
-            direction=TradeDirection.CALL,
-            amount=10.0,
-            entry_price=1.1000,
-            exit_price=1.0990,
-            profit_loss=-10.0,
-            is_win=False,
-            timestamp=datetime.now()
-        )
-        risk_manager.record_trade_result(trade_result)
+        risk_manager.record_trade_result(_make_trade(1, *_LOSS))
         
         metrics = risk_manager.get_risk_metrics(current_balance)
         
@@ -305,11 +300,12 @@ class TestRiskManager:
         
         assert risk_manager.is_trading_paused()
     
-    def test_is_trading_paused_expired_pause(self, risk_manager):
+    def test_is_trading_paused_expired_pause(self, risk_manager, frozen_clock):
         """Test checking if trading is paused when pause has expired."""
-        # Set pause that expired 1 minute ago
-        risk_manager.is_paused = True
-        risk_manager.pause_until = datetime.now() - timedelta(minutes=1)
+        risk_manager._pause_trading("Test pause", duration_minutes=1)
+        
+        # Move the clock past the end of the pause
+        frozen_clock._now += timedelta(minutes=2)
         
         assert not risk_manager.is_trading_paused()
         assert not risk_manager.is_paused
@@ -334,7 +330,7 @@ class TestRiskManager:
         """Test resetting daily metrics."""
         # Set up some initial state
         risk_manager.daily_start_balance = 1000.0
-        risk_manager.trade_history = [Mock()]
+        risk_manager.trade_history = [object()]
         risk_manager._pause_trading("Daily loss limit exceeded")
         
         new_balance = 1100.0
@@ -344,61 +340,21 @@ class TestRiskManager:
         assert len(risk_manager.trade_history) == 0
         assert not risk_manager.is_paused  # Should resume if paused due to daily loss
     
-    def test_validate_trade_request_when_paused(self, risk_manager, sample_trade_request, sample_balance):
-        """Test validation when trading is paused."""
-        risk_manager._pause_trading("Test pause")
-        
-        result = risk_manager.validate_trade_request(sample_trade_request, sample_balance)
-        
-        assert not result.is_valid
-        assert "Trading is paused" in result.error_message
-    
-    def test_count_consecutive_losses_mixed_results(self, risk_manager):
-        """Test counting consecutive losses with mixed win/loss results."""
-        # Add trades: Win, Loss, Loss, Loss (3 consecutive losses at end)
-        trades = [
-            (True, "win_001"),
-            (False, "loss_001"),
-            (False, "loss_002"),
-            (False, "loss_003")
+    @pytest.mark.parametrize("sequence,expected_count", [
+        ((_WIN, _LOSS, _LOSS, _LOSS), 3),  # 3 consecutive losses at end
+        ((_WIN,), 0),
+        ((_LOSS, _WIN, _LOSS), 1),
+        ((), 0),
+    ], ids=["mixed", "no_losses", "interrupted", "empty"])
+    def test_count_consecutive_losses(self, risk_manager, sequence, expected_count):
+        """Test counting consecutive losses from the most recent trades."""
+        risk_manager.trade_history = [
+            _make_trade(i, *trade_case) for i, trade_case in enumerate(sequence)
         ]
         
-        for is_win, trade_id in trades:
-            trade_result = TradeResult(
-                trade_id=trade_id,
-                symbol="EURUSD",
-                direction=TradeDirection.CALL,
-                amount=10.0,
-                entry_price=1.1000,
-                exit_price=1.1010 if is_win else 1.0990,
-                profit_loss=8.0 if is_win else -10.0,
-                is_win=is_win,
-                timestamp=datetime.now()
-            )
-            risk_manager.trade_history.append(trade_result)
-        
-        consecutive_losses = risk_manager._count_consecutive_losses()
-        assert consecutive_losses == 3
-    
-    def test_count_consecutive_losses_no_losses(self, risk_manager):
-        """Test counting consecutive losses when there are no losses."""
-        trade_result = TradeResult(
-            trade_id="win_001",
-            symbol="EURUSD",
-            direction=TradeDirection.CALL,
-            amount=10.0,
-            entry_price=1.1000,
-            exit_price=1.1010,
-            profit_loss=8.0,
-            is_win=True,
-            timestamp=datetime.now()
-        )
-        risk_manager.trade_history.append(trade_result)
-        
-        consecutive_losses = risk_manager._count_consecutive_losses()
-        assert consecutive_losses == 0
+        assert risk_manager._count_consecutive_losses() == expected_count
     
-    def test_pause_trading_with_duration(self, risk_manager):
+    def test_pause_trading_with_duration(self, risk_manager, frozen_clock):
         """Test pausing trading with custom duration."""
         reason = "Test pause"
         duration = 30
@@ -409,10 +365,8 @@ class TestRiskManager:
         assert risk_manager.pause_reason == reason
         assert risk_manager.pause_until is not None
         
-        # Check that pause_until is approximately 30 minutes from now
-        expected_time = datetime.now() + timedelta(minutes=duration)
-        time_diff = abs((risk_manager.pause_until - expected_time).total_seconds())
-        assert time_diff < 5  # Within 5 seconds tolerance
+        # Check that pause_until is exactly 30 minutes from the frozen now
+        assert risk_manager.pause_until == frozen_clock.now() + timedelta(minutes=duration)
 
 
 class TestRiskMetrics:
@@ -425,7 +379,7 @@ class TestRiskMetrics:
             daily_loss_percent=5.0,
             consecutive_losses=2,
             trades_today=10,
-            last_loss_time=datetime.now(),
+            last_loss_time=datetime(2024, 1, 1),
             is_paused=False,
             pause_reason=None
         )
@@ -465,34 +419,17 @@ class TestEdgeCases:
         expected_size = large_balance * 0.02
         assert position_size == expected_size
     
-    def test_trade_history_cleanup(self, risk_manager):
+    def test_trade_history_cleanup(self, risk_manager, frozen_clock):
         """Test that trade history is cleaned up to keep only today's trades."""
-        # Add old trade (yesterday)
-        old_trade = TradeResult(
-            trade_id="old_001",
-            symbol="EURUSD",
-            direction=TradeDirection.CALL,
-            amount=10.0,
-            entry_price=1.1000,
-            exit_price=1.1010,
-            profit_loss=8.0,
-            is_win=True,
-            timestamp=datetime.now() - timedelta(days=1)
+        # Add old trade (one second before today's midnight)
+        midnight = frozen_clock.now().replace(hour=0, minute=0, second=0)
+        old_trade = dataclasses.replace(
+            _PROTO_TRADE, trade_id="old_001", timestamp=midnight - timedelta(seconds=1)
         )
         risk_manager.trade_history.append(old_trade)
         
-        # Add new trade (today)
-        new_trade = TradeResult(
-            trade_id="new_001",
-            symbol="EURUSD",
-            direction=TradeDirection.CALL,
-            amount=10.0,
-            entry_price=1.1000,
-            exit_price=1.1010,
-            profit_loss=8.0,
-            is_win=True,
-            timestamp=datetime.now()
-        )
+        # Add new trade (today's midnight)
+        new_trade = dataclasses.replace(_PROTO_TRADE, trade_id="new_001", timestamp=midnight)
         
         # Recording new trade should clean up old trades
         risk_manager.record_trade_result(new_trade)
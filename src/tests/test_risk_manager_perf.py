@@ -0,0 +1,218 @@
+"""Scenario and benchmark tests for Risk Manager.
+
+Ported from the ``validate_risk_manager.py`` walkthrough. The hot paths
+(``validate_trade_request``, ``record_trade_result``, ``get_risk_metrics``)
+are timed through the ``pytest-benchmark`` ``benchmark`` fixture when that
+plugin is installed; without it they are called once directly, so their
+assertions still run.
+"""
+
+import dataclasses
+import importlib.util
+from datetime import datetime
+from typing import List
+
+import pytest
+
+from src.backend import risk_manager as risk_manager_module
+from src.backend.risk_manager import RiskManager
+from src.backend.models import (
+    TradeRequest,
+    TradeResult,
+    Balance,
+    TradeDirection,
+    ErrorCode
+)
+from src.backend.config import TradingConfig
+
+
+# Every test runs against the conftest frozen clock
+pytestmark = pytest.mark.usefixtures("frozen_clock")
+
+
+_HAS_BENCHMARK = importlib.util.find_spec("pytest_benchmark") is not None
+
+# Keep cyclic GC from firing mid-round and skewing microsecond timings
+risk_manager_benchmark = pytest.mark.benchmark(
+    group="risk_manager", disable_gc=True, warmup=True
+)
+
+
+_CONFIG = TradingConfig(
+    default_trade_amount=10.0,
+    max_daily_loss_percent=5.0,
+    max_trade_percent=2.0,
+    consecutive_loss_limit=3,
+    demo_mode=True
+)
+
+
+_PROTO_LOSS = TradeResult(
+    trade_id="loss_000",
+    symbol="EURUSD",
+    direction=TradeDirection.CALL,
+    amount=10.0,
+    entry_price=1.1000,
+    exit_price=1.0990,
+    profit_loss=-10.0,
+    is_win=False,
+    timestamp=datetime(2024, 1, 1)
+)
+
+
+def _now() -> datetime:
+    """The risk manager's current time, frozen by ``frozen_clock``."""
+    return risk_manager_module.datetime.now()
+
+
+def _loss_trade(trade_id: str) -> TradeResult:
+    """Build a losing EURUSD trade stamped at the frozen clock."""
+    return dataclasses.replace(_PROTO_LOSS, trade_id=trade_id, timestamp=_now())
+
+
+def _loss_streak(count: int) -> List[TradeResult]:
+    """Build ``count`` consecutive losing trades stamped at the frozen clock."""
+    now = _now()
+    return [
+        dataclasses.replace(_PROTO_LOSS, trade_id=f"loss_{i + 1:03d}", timestamp=now)
+        for i in range(count)
+    ]
+
+
+def _trade_request(amount: float, is_demo: bool = True) -> TradeRequest:
+    """Build a 60s EURUSD CALL request."""
+    return TradeRequest(
+        symbol="EURUSD",
+        direction=TradeDirection.CALL,
+        amount=amount,
+        expiration_time=60,
+        is_demo=is_demo
+    )
+
+
+class _DirectCall:
+    """Stand-in for the ``benchmark`` fixture that calls the function once, untimed."""
+
+    def __call__(self, func, *args, **kwargs):
+        return func(*args, **kwargs)
+
+    def pedantic(self, func, args=(), kwargs=None, setup=None, **_options):
+        if setup is not None:
+            args, kwargs = setup()
+        return func(*args, **(kwargs or {}))
+
+
+# Requesting ``benchmark`` by name keeps these tests selected under --benchmark-only
+if _HAS_BENCHMARK:
+    @pytest.fixture
+    def bench(benchmark):
+        """The pytest-benchmark ``benchmark`` fixture."""
+        return benchmark
+else:
+    @pytest.fixture
+    def bench():
+        """Direct caller standing in for ``benchmark`` without pytest-benchmark."""
+        return _DirectCall()
+
+
+@pytest.fixture
+def risk_setup(frozen_clock):
+    """Fresh risk manager and a $1000 balance."""
+    balance = Balance(
+        total_balance=1000.0,
+        available_balance=1000.0,
+        currency="USD",
+        timestamp=frozen_clock.now()
+    )
+    return RiskManager(_CONFIG), balance
+
+
+@pytest.mark.parametrize("risk_percent,expected", [(None, 20.0), (1.0, 10.0)])
+def test_position_sizing(risk_setup, risk_percent, expected):
+    """Default sizing uses max_trade_percent; a custom percent overrides it."""
+    risk_manager, balance = risk_setup
+    assert risk_manager.calculate_position_size(balance.total_balance, risk_percent) == expected
+
+
+@risk_manager_benchmark
+@pytest.mark.parametrize("amount,expected_valid", [(20.0, True), (50.0, False), (0.5, True)])
+def test_validate_trade_request(bench, risk_setup, amount, expected_valid):
+    """Amounts up to 2% of balance pass; larger ones are rejected."""
+    risk_manager, balance = risk_setup
+    request = _trade_request(amount)
+
+    result = bench(risk_manager.validate_trade_request, request, balance)
+
+    assert result.is_valid is expected_valid
+    if not expected_valid:
+        assert result.error_code is ErrorCode.EXCEEDS_MAX_TRADE_PERCENT
+
+
+@pytest.mark.parametrize("current_balance,within_limits", [(960.0, True), (940.0, False)])
+def test_daily_loss_limits(risk_setup, current_balance, within_limits):
+    """A 4% daily loss stays within the 5% limit; a 6% loss pauses trading."""
+    risk_manager, _ = risk_setup
+    risk_manager.daily_start_balance = 1000.0
+
+    assert risk_manager.check_daily_limits(current_balance) is within_limits
+    assert risk_manager.is_paused is not within_limits
+
+
+@pytest.mark.parametrize("losses,expected_paused", [(2, False), (3, True)])
+def test_consecutive_loss_circuit_breaker(risk_setup, losses, expected_paused):
+    """The third consecutive loss trips the circuit breaker."""
+    risk_manager, _ = risk_setup
+    risk_manager.record_trade_results(_loss_streak(losses))
+
+    assert risk_manager.is_paused is expected_paused
+
+
+@risk_manager_benchmark
+def test_record_trade_result(bench):
+    """Recording a loss on a fresh manager counts it without pausing."""
+    def setup():
+        return (RiskManager(_CONFIG), _loss_trade("loss_001")), {}
+
+    def record(risk_manager, trade):
+        risk_manager.record_trade_result(trade)
+        return risk_manager
+
+    risk_manager = bench.pedantic(record, setup=setup, rounds=5, iterations=1)
+
+    assert risk_manager.get_risk_metrics(1000.0).consecutive_losses == 1
+    assert not risk_manager.is_paused
+
+
+def test_demo_mode_enforcement(risk_setup):
+    """Real trades are blocked while demo mode is enabled."""
+    risk_manager, balance = risk_setup
+    result = risk_manager.validate_trade_request(_trade_request(10.0, is_demo=False), balance)
+
+    assert not result.is_valid
+    assert result.error_code is ErrorCode.DEMO_MODE_VIOLATION
+
+
+@risk_manager_benchmark
+def test_get_risk_metrics(bench, risk_setup):
+    """Metrics reflect recorded losses and the resulting pause."""
+    risk_manager, _ = risk_setup
+    risk_manager.daily_start_balance = 1000.0
+    risk_manager.record_trade_results(_loss_streak(3))
+
+    metrics = bench(risk_manager.get_risk_metrics, 950.0)
+
+    assert metrics.consecutive_losses == 3
+    assert metrics.trades_today == 3
+    assert metrics.is_paused
+    assert metrics.daily_loss == 50.0
+    assert metrics.daily_loss_percent == 5.0
+
+
+def test_manual_resume(risk_setup):
+    """Resuming a paused manager succeeds once and clears the pause."""
+    risk_manager, _ = risk_setup
+    risk_manager.record_trade_results(_loss_streak(3))
+
+    assert risk_manager.resume_trading()
+    assert not risk_manager.is_paused
+    assert not risk_manager.resume_trading()
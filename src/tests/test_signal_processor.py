@@ -2,38 +2,117 @@
 
 import pytest
 import asyncio
-from datetime import datetime, timedelta
-from unittest.mock import Mock, AsyncMock, patch
+import dataclasses
+import functools
+import re
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 from typing import List
 
+import numpy as np
+
 from src.backend.signal_processor import SignalProcessor, TechnicalIndicators, get_signal_processor
-from src.backend.models import MarketData, Signal, SignalType
+from src.backend.models import MarketData, MarketDataBatch, Signal, SignalType
+
+
+# Error patterns asserted by several tests, compiled once
+_RE_INSUFFICIENT = re.compile(r"Need at least .* prices")
+_RE_NONPOSITIVE_PRICES = re.compile(r"All prices must be positive")
+_RE_RSI_PERIOD = re.compile(r"RSI period must be positive")
+_RE_SMA_PERIOD = re.compile(r"SMA period must be positive")
+
+
+@functools.lru_cache(maxsize=64)
+def _linspace_prices(start: float, step: float, n: int) -> np.ndarray:
+    """Read-only evenly stepped price series, shared across tests with the same shape."""
+    prices = start + step * np.arange(n)
+    prices.flags.writeable = False
+    return prices
+
+
+def _minute_timestamps(n: int) -> np.ndarray:
+    """One-minute candle timestamps (datetime64[us]) ending a minute before now."""
+    base = np.datetime64(datetime.now(), "us") - np.timedelta64(n, "m")
+    return base + np.arange(n, dtype="timedelta64[m]")
+
+
+def _market_batch(prices, symbol: str = "EURUSD", spread: float = 0.0001) -> MarketDataBatch:
+    """Create columnar market data from prices without per-candle records."""
+    closes = np.asarray(prices, dtype=np.float64)
+    return MarketDataBatch(
+        symbol=symbol,
+        timestamp=_minute_timestamps(len(closes)),
+        open_price=closes,
+        high_price=closes + spread,
+        low_price=closes - spread,
+        close_price=closes,
+        volume=np.full(len(closes), 1000.0)
+    )
+
+
+def _walk_prices(start: float, steps: np.ndarray) -> np.ndarray:
+    """Prices after applying each step in turn to a running price, starting from start."""
+    return np.cumsum(np.concatenate([[start], steps]))[1:]
+
+
+def make_fake_api(validate=True, market_data=None, raise_exc=None):
+    """Stand-in API manager whose async methods return canned values without call tracking."""
+    async def validate_signal(symbol, signal):
+        if raise_exc is not None:
+            raise raise_exc
+        return validate
+    
+    async def get_market_data(symbol, timeframe="1m", limit=50):
+        if raise_exc is not None:
+            raise raise_exc
+        return market_data
+    
+    return SimpleNamespace(validate_signal=validate_signal, get_market_data=get_market_data)
 
 
 class TestSignalProcessor:
     """Test cases for SignalProcessor class."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.processor = SignalProcessor(rsi_period=14, sma_period=20)
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def shared_processor(cls, request):
+        """Share one processor across the class; tests must not mutate it."""
+        request.cls.processor = SignalProcessor(rsi_period=14, sma_period=20)
+    
+    @pytest.fixture(scope="class")
+    @classmethod
+    def api(cls):
+        """Patch get_api_manager once for the class; tests install the manager it returns."""
+        holder = SimpleNamespace(manager=None)
+        
+        async def _get_api_manager():
+            return holder.manager
+        
+        with patch('src.backend.signal_processor.get_api_manager', _get_api_manager):
+            yield holder
+    
+    @pytest.fixture
+    def processor(self):
+        """Unshared processor for tests that change parameters or cache an API manager."""
+        return SignalProcessor(rsi_period=14, sma_period=20)
         
     def create_market_data(self, prices: List[float], symbol: str = "EURUSD") -> List[MarketData]:
         """Create market data from price list."""
-        market_data = []
-        base_time = datetime.now() - timedelta(minutes=len(prices))
+        timestamps = _minute_timestamps(len(prices)).tolist()
         
-        for i, price in enumerate(prices):
-            market_data.append(MarketData(
+        return [
+            MarketData(
                 symbol=symbol,
-                timestamp=base_time + timedelta(minutes=i),
+                timestamp=timestamp,
                 open_price=price,
                 high_price=price + 0.0001,
                 low_price=price - 0.0001,
                 close_price=price,
                 volume=1000.0
-            ))
-        
-        return market_data
+            )
+            for timestamp, price in zip(timestamps, np.asarray(prices, dtype=np.float64).tolist())
+        ]
     
     def test_initialization(self):
         """Test SignalProcessor initialization."""
@@ -61,8 +140,7 @@ class TestSignalProcessor:
     def test_calculate_rsi_oversold(self):
         """Test RSI calculation for oversold condition."""
         # Create declining price series
-        base_price = 1.1000
-        prices = [base_price - (i * 0.001) for i in range(20)]
+        prices = _linspace_prices(1.1000, -0.001, 20)
         
         rsi = self.processor.calculate_rsi(prices)
         
@@ -72,8 +150,7 @@ class TestSignalProcessor:
     def test_calculate_rsi_overbought(self):
         """Test RSI calculation for overbought condition."""
         # Create rising price series
-        base_price = 1.1000
-        prices = [base_price + (i * 0.001) for i in range(20)]
+        prices = _linspace_prices(1.1000, 0.001, 20)
         
         rsi = self.processor.calculate_rsi(prices)
         
@@ -89,36 +166,55 @@ class TestSignalProcessor:
     
     def test_calculate_rsi_invalid_period(self):
         """Test RSI calculation with invalid period."""
-        prices = [1.1000 + i * 0.0001 for i in range(20)]
+        prices = _linspace_prices(1.1000, 0.0001, 20)
         
-        with pytest.raises(ValueError, match="RSI period must be positive"):
+        with pytest.raises(ValueError, match=_RE_RSI_PERIOD):
             self.processor.calculate_rsi(prices, period=0)
         
-        with pytest.raises(ValueError, match="RSI period must be positive"):
+        with pytest.raises(ValueError, match=_RE_RSI_PERIOD):
             self.processor.calculate_rsi(prices, period=-5)
     
     def test_calculate_rsi_invalid_prices(self):
         """Test RSI calculation with invalid prices."""
         # Test with negative prices
-        prices = [1.1000, -1.1001, 1.1002] + [1.1000 + i * 0.0001 for i in range(15)]
+        prices = np.concatenate([[1.1000, -1.1001, 1.1002], _linspace_prices(1.1000, 0.0001, 15)])
         
-        with pytest.raises(ValueError, match="All prices must be positive"):
+        with pytest.raises(ValueError, match=_RE_NONPOSITIVE_PRICES):
             self.processor.calculate_rsi(prices)
         
         # Test with zero prices
-        prices = [1.1000, 0.0, 1.1002] + [1.1000 + i * 0.0001 for i in range(15)]
+        prices = np.concatenate([[1.1000, 0.0, 1.1002], _linspace_prices(1.1000, 0.0001, 15)])
         
-        with pytest.raises(ValueError, match="All prices must be positive"):
+        with pytest.raises(ValueError, match=_RE_NONPOSITIVE_PRICES):
             self.processor.calculate_rsi(prices)
         
         # Test with empty list - should fail with insufficient data message
-        with pytest.raises(ValueError, match="Need at least .* prices"):
+        with pytest.raises(ValueError, match=_RE_INSUFFICIENT):
             self.processor.calculate_rsi([])
     
+    def test_calculate_rsi_wilder_smoothing(self):
+        """Test RSI smoothing over a long series matches Wilder's recursive form."""
+        prices = [1.1000 + 0.001 * ((i * 7) % 11 - 5) for i in range(60)]
+        period = 14
+        
+        deltas = [prices[i] - prices[i - 1] for i in range(1, len(prices))]
+        gains = [max(delta, 0.0) for delta in deltas]
+        losses = [max(-delta, 0.0) for delta in deltas]
+        avg_gain = sum(gains[:period]) / period
+        avg_loss = sum(losses[:period]) / period
+        for gain, loss in zip(gains[period:], losses[period:]):
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+        expected_rsi = 100 - 100 / (1 + avg_gain / avg_loss)
+        
+        rsi = self.processor.calculate_rsi(prices, period=period)
+        
+        assert rsi == pytest.approx(expected_rsi, abs=1e-9)
+    
     def test_calculate_rsi_no_losses(self):
         """Test RSI calculation when there are no losses (all gains)."""
         # Create strictly increasing prices
-        prices = [1.1000 + i * 0.0001 for i in range(20)]
+        prices = _linspace_prices(1.1000, 0.0001, 20)
         
         rsi = self.processor.calculate_rsi(prices)
         
@@ -143,6 +239,16 @@ class TestSignalProcessor:
         
         assert abs(sma - expected_sma) < 1e-10
     
+    def test_calculate_sma_series(self):
+        """Test rolling SMA series over every full window."""
+        prices = [1.1000, 1.1001, 1.1002, 1.1003, 1.1004, 1.1005, 1.1006]
+        
+        series = self.processor.calculate_sma_series(prices, period=3)
+        expected = [sum(prices[i:i + 3]) / 3 for i in range(len(prices) - 2)]
+        
+        assert series.tolist() == pytest.approx(expected, abs=1e-10)
+        assert series[-1] == pytest.approx(self.processor.calculate_sma(prices, period=3), abs=1e-12)
+    
     def test_calculate_sma_insufficient_data(self):
         """Test SMA calculation with insufficient data."""
         prices = [1.1000, 1.1001]  # Only 2 prices
@@ -152,31 +258,31 @@ class TestSignalProcessor:
     
     def test_calculate_sma_invalid_period(self):
         """Test SMA calculation with invalid period."""
-        prices = [1.1000 + i * 0.0001 for i in range(25)]
+        prices = _linspace_prices(1.1000, 0.0001, 25)
         
-        with pytest.raises(ValueError, match="SMA period must be positive"):
+        with pytest.raises(ValueError, match=_RE_SMA_PERIOD):
             self.processor.calculate_sma(prices, period=0)
         
-        with pytest.raises(ValueError, match="SMA period must be positive"):
+        with pytest.raises(ValueError, match=_RE_SMA_PERIOD):
             self.processor.calculate_sma(prices, period=-5)
     
     def test_calculate_sma_invalid_prices(self):
         """Test SMA calculation with invalid prices."""
         # Test with negative prices
-        prices = [1.1000, -1.1001] + [1.1000 + i * 0.0001 for i in range(20)]
+        prices = np.concatenate([[1.1000, -1.1001], _linspace_prices(1.1000, 0.0001, 20)])
         
-        with pytest.raises(ValueError, match="All prices must be positive"):
+        with pytest.raises(ValueError, match=_RE_NONPOSITIVE_PRICES):
             self.processor.calculate_sma(prices)
         
         # Test with empty list - should fail with insufficient data message
-        with pytest.raises(ValueError, match="Need at least .* prices"):
+        with pytest.raises(ValueError, match=_RE_INSUFFICIENT):
             self.processor.calculate_sma([])
     
     def test_calculate_technical_indicators(self):
         """Test calculation of all technical indicators."""
         # Create enough data for both RSI and SMA
-        prices = [1.1000 + i * 0.0001 for i in range(25)]
-        market_data = self.create_market_data(prices)
+        prices = _linspace_prices(1.1000, 0.0001, 25)
+        market_data = _market_batch(prices)
         
         indicators = self.processor.calculate_technical_indicators(market_data)
         
@@ -185,6 +291,45 @@ class TestSignalProcessor:
         assert indicators.sma > 0
         assert indicators.current_price == prices[-1]
         assert isinstance(indicators.timestamp, datetime)
+        # The fused path matches the standalone indicator methods
+        assert indicators.rsi == self.processor.calculate_rsi(prices)
+        assert indicators.sma == self.processor.calculate_sma(prices)
+    
+    def test_calculate_technical_indicators_records_match_batch(self):
+        """Test that MarketData records and a batch give the same indicators."""
+        prices = [1.1000 + 0.001 * ((i * 7) % 11 - 5) for i in range(30)]
+        records = self.create_market_data(prices)
+        
+        # Separate processors, so the second call is computed rather than a cache hit
+        from_records = SignalProcessor().calculate_technical_indicators(records)
+        from_batch = SignalProcessor().calculate_technical_indicators(MarketDataBatch.from_records(records))
+        
+        assert from_records == from_batch
+        assert from_records.timestamp == records[-1].timestamp
+    
+    def test_calculate_technical_indicators_cached(self, processor):
+        """Test that repeat calls reuse indicators until the candles or periods change."""
+        prices = _linspace_prices(1.1000, 0.0001, 25)
+        market_data = _market_batch(prices)
+        
+        first = processor.calculate_technical_indicators(market_data)
+        rsi = first.rsi
+        first.rsi = 0.0  # Mutating a result must not leak into later hits
+        second = processor.calculate_technical_indicators(market_data)
+        assert second.rsi == rsi
+        assert second is not processor.calculate_technical_indicators(market_data)
+        
+        # A revised last candle with the same timestamp is recomputed
+        revised_close = market_data.close_price.copy()
+        revised_close[-1] += 0.0005
+        revised = dataclasses.replace(market_data, close_price=revised_close)
+        updated = processor.calculate_technical_indicators(revised)
+        assert updated is not first
+        assert updated.current_price == revised_close[-1]
+        
+        processor.update_parameters(sma_period=10)
+        recomputed = processor.calculate_technical_indicators(revised)
+        assert recomputed.sma == processor.calculate_sma(revised_close)
     
     def test_calculate_technical_indicators_insufficient_data(self):
         """Test technical indicators with insufficient data."""
@@ -199,18 +344,48 @@ class TestSignalProcessor:
         with pytest.raises(ValueError, match="Market data cannot be empty"):
             self.processor.calculate_technical_indicators([])
     
+    def test_streaming_indicators_match_bulk(self, processor):
+        """Test that seeded O(1) updates track the bulk RSI and SMA."""
+        steps = np.random.default_rng(7).normal(0.0, 0.0005, 60)
+        prices = _walk_prices(1.1000, steps).tolist()
+        
+        rsi, sma = processor.seed_indicators(prices[:20])
+        assert rsi == pytest.approx(processor.calculate_rsi(prices[:20]), abs=1e-12)
+        assert sma == pytest.approx(processor.calculate_sma(prices[:20]), abs=1e-12)
+        
+        for end in range(21, len(prices) + 1):
+            rsi, sma = processor.update_indicators(prices[end - 1])
+            assert rsi == pytest.approx(processor.calculate_rsi(prices[:end]), abs=1e-12)
+            assert sma == pytest.approx(processor.calculate_sma(prices[:end]), abs=1e-12)
+    
+    def test_streaming_indicators_require_seed(self, processor):
+        """Test that updates need seeded state, which a period change discards."""
+        with pytest.raises(ValueError, match="must be seeded"):
+            processor.update_indicators(1.1)
+        
+        with pytest.raises(ValueError, match="Need at least 20 data points"):
+            processor.seed_indicators([1.1] * 19)
+        
+        processor.seed_indicators(_linspace_prices(1.1000, 0.0001, 20))
+        with pytest.raises(ValueError, match=_RE_NONPOSITIVE_PRICES):
+            processor.update_indicators(0.0)
+        
+        processor.update_parameters(sma_period=10)
+        with pytest.raises(ValueError, match="must be seeded"):
+            processor.update_indicators(1.1)
+    
     def test_generate_signal_buy(self):
         """Test BUY signal generation."""
         # Create data that should generate a BUY signal
         # RSI < 30 and price > SMA
         
         # Start with declining prices to get low RSI
-        declining_prices = [1.1000 - i * 0.0005 for i in range(15)]
+        declining_prices = _linspace_prices(1.1000, -0.0005, 15)
         # Then add some higher prices to get price > SMA
-        rising_prices = [1.1000 + i * 0.0002 for i in range(10)]
+        rising_prices = _linspace_prices(1.1000, 0.0002, 10)
         
-        all_prices = declining_prices + rising_prices
-        market_data = self.create_market_data(all_prices)
+        all_prices = np.concatenate([declining_prices, rising_prices])
+        market_data = _market_batch(all_prices)
         
         signal = self.processor.generate_signal(market_data)
         
@@ -226,12 +401,12 @@ class TestSignalProcessor:
         # RSI > 70 and price < SMA
         
         # Start with rising prices to get high RSI
-        rising_prices = [1.1000 + i * 0.0005 for i in range(15)]
+        rising_prices = _linspace_prices(1.1000, 0.0005, 15)
         # Then add some lower prices to get price < SMA
-        declining_prices = [1.1000 - i * 0.0002 for i in range(10)]
+        declining_prices = _linspace_prices(1.1000, -0.0002, 10)
         
-        all_prices = rising_prices + declining_prices
-        market_data = self.create_market_data(all_prices)
+        all_prices = np.concatenate([rising_prices, declining_prices])
+        market_data = _market_batch(all_prices)
         
         signal = self.processor.generate_signal(market_data)
         
@@ -244,13 +419,31 @@ class TestSignalProcessor:
         """Test when no signal should be generated."""
         # Create neutral data (RSI around 50, price near SMA)
         prices = [1.1000 + (i % 2) * 0.0001 for i in range(25)]  # Oscillating prices
-        market_data = self.create_market_data(prices)
+        market_data = _market_batch(prices)
         
         signal = self.processor.generate_signal(market_data)
         
         # Should not generate a signal for neutral conditions
         assert signal is None
     
+    @pytest.mark.parametrize("rsi,current_price,expected", [
+        (50.0, 1.1000, None),  # Neutral RSI, price at SMA
+        (20.0, 1.1010, SignalType.BUY),  # Oversold, price above SMA
+        (20.0, 1.0990, None),  # Oversold but price below SMA
+        (80.0, 1.0990, SignalType.SELL),  # Overbought, price below SMA
+        (80.0, 1.1010, None),  # Overbought but price above SMA
+    ], ids=["neutral", "buy", "oversold_below_sma", "sell", "overbought_above_sma"])
+    def test_decide_signal(self, rsi, current_price, expected):
+        """Test the crossover rules on precomputed indicators."""
+        indicators = TechnicalIndicators(
+            rsi=rsi,
+            sma=1.1000,
+            current_price=current_price,
+            timestamp=datetime.now()
+        )
+        
+        assert self.processor._decide_signal(indicators) is expected
+    
     def test_generate_signal_empty_data(self):
         """Test signal generation with empty data."""
         signal = self.processor.generate_signal([])
@@ -305,7 +498,7 @@ class TestSignalProcessor:
         assert 0 <= confidence <= 1
     
     @pytest.mark.asyncio
-    async def test_validate_signal_with_alpha_vantage_success(self):
+    async def test_validate_signal_with_alpha_vantage_success(self, processor, api):
         """Test signal validation with Alpha Vantage (success case)."""
         signal = Signal(
             symbol="EURUSD",
@@ -317,19 +510,16 @@ class TestSignalProcessor:
             current_price=1.1010
         )
         
-        # Mock API manager
-        mock_api_manager = AsyncMock()
-        mock_api_manager.validate_signal.return_value = True
+        api.manager = make_fake_api(validate=True)
         
-        with patch('src.backend.signal_processor.get_api_manager', return_value=mock_api_manager):
-            new_confidence = await self.processor.validate_signal_with_alpha_vantage(signal)
+        new_confidence = await processor.validate_signal_with_alpha_vantage(signal)
         
         # Confidence should be boosted for validated signals
         assert new_confidence > signal.confidence
         assert new_confidence <= 1.0
     
     @pytest.mark.asyncio
-    async def test_validate_signal_with_alpha_vantage_failure(self):
+    async def test_validate_signal_with_alpha_vantage_failure(self, processor, api):
         """Test signal validation with Alpha Vantage (failure case)."""
         signal = Signal(
             symbol="EURUSD",
@@ -341,19 +531,16 @@ class TestSignalProcessor:
             current_price=1.1010
         )
         
-        # Mock API manager
-        mock_api_manager = AsyncMock()
-        mock_api_manager.validate_signal.return_value = False
+        api.manager = make_fake_api(validate=False)
         
-        with patch('src.backend.signal_processor.get_api_manager', return_value=mock_api_manager):
-            new_confidence = await self.processor.validate_signal_with_alpha_vantage(signal)
+        new_confidence = await processor.validate_signal_with_alpha_vantage(signal)
         
         # Confidence should be reduced for invalidated signals
         assert new_confidence < signal.confidence
         assert new_confidence >= 0.0
     
     @pytest.mark.asyncio
-    async def test_validate_signal_with_alpha_vantage_error(self):
+    async def test_validate_signal_with_alpha_vantage_error(self, processor, api):
         """Test signal validation with Alpha Vantage (error case)."""
         signal = Signal(
             symbol="EURUSD",
@@ -365,30 +552,28 @@ class TestSignalProcessor:
             current_price=1.1010
         )
         
-        # Mock API manager to raise exception
-        mock_api_manager = AsyncMock()
-        mock_api_manager.validate_signal.side_effect = Exception("API Error")
+        # API manager that raises
+        api.manager = make_fake_api(raise_exc=Exception("API Error"))
         
-        with patch('src.backend.signal_processor.get_api_manager', return_value=mock_api_manager):
-            new_confidence = await self.processor.validate_signal_with_alpha_vantage(signal)
+        new_confidence = await processor.validate_signal_with_alpha_vantage(signal)
         
         # Confidence should remain unchanged on error
         assert new_confidence == signal.confidence
     
     @pytest.mark.asyncio
-    async def test_process_market_data_and_generate_signal(self):
+    async def test_process_market_data_and_generate_signal(self, processor, api):
         """Test complete market data processing and signal generation."""
         # Mock API manager
         mock_api_manager = AsyncMock()
         
         # Create mock market data
-        prices = [1.1000 - i * 0.0005 for i in range(15)] + [1.1000 + i * 0.0002 for i in range(10)]
+        prices = np.concatenate([_linspace_prices(1.1000, -0.0005, 15), _linspace_prices(1.1000, 0.0002, 10)])
         mock_market_data = self.create_market_data(prices)
         mock_api_manager.get_market_data.return_value = mock_market_data
         mock_api_manager.validate_signal.return_value = True
         
-        with patch('src.backend.signal_processor.get_api_manager', return_value=mock_api_manager):
-            signal = await self.processor.process_market_data_and_generate_signal("EURUSD")
+        api.manager = mock_api_manager
+        signal = await processor.process_market_data_and_generate_signal("EURUSD")
         
         # Should call API manager methods
         mock_api_manager.get_market_data.assert_called_once()
@@ -399,26 +584,22 @@ class TestSignalProcessor:
             mock_api_manager.validate_signal.assert_called_once()
     
     @pytest.mark.asyncio
-    async def test_process_market_data_and_generate_signal_no_data(self):
+    async def test_process_market_data_and_generate_signal_no_data(self, processor, api):
         """Test processing when no market data is available."""
-        # Mock API manager to return empty data
-        mock_api_manager = AsyncMock()
-        mock_api_manager.get_market_data.return_value = []
+        # API manager that returns empty data
+        api.manager = make_fake_api(market_data=[])
         
-        with patch('src.backend.signal_processor.get_api_manager', return_value=mock_api_manager):
-            signal = await self.processor.process_market_data_and_generate_signal("EURUSD")
+        signal = await processor.process_market_data_and_generate_signal("EURUSD")
         
         assert signal is None
     
     @pytest.mark.asyncio
-    async def test_process_market_data_and_generate_signal_error(self):
+    async def test_process_market_data_and_generate_signal_error(self, processor, api):
         """Test processing when API error occurs."""
-        # Mock API manager to raise exception
-        mock_api_manager = AsyncMock()
-        mock_api_manager.get_market_data.side_effect = Exception("API Error")
+        # API manager that raises
+        api.manager = make_fake_api(raise_exc=Exception("API Error"))
         
-        with patch('src.backend.signal_processor.get_api_manager', return_value=mock_api_manager):
-            signal = await self.processor.process_market_data_and_generate_signal("EURUSD")
+        signal = await processor.process_market_data_and_generate_signal("EURUSD")
         
         assert signal is None
     
@@ -429,37 +610,44 @@ class TestSignalProcessor:
         assert self.processor.get_signal_strength_description(0.5) == "Moderate"
         assert self.processor.get_signal_strength_description(0.3) == "Weak"
         assert self.processor.get_signal_strength_description(0.1) == "Very Weak"
+        
+        # Each bound belongs to the stronger label
+        assert self.processor.get_signal_strength_description(0.8) == "Very Strong"
+        assert self.processor.get_signal_strength_description(0.6) == "Strong"
+        assert self.processor.get_signal_strength_description(0.4) == "Moderate"
+        assert self.processor.get_signal_strength_description(0.2) == "Weak"
+        assert self.processor.get_signal_strength_description(0.0) == "Very Weak"
     
-    def test_update_parameters(self):
+    def test_update_parameters(self, processor):
         """Test updating signal processor parameters."""
         # Test valid updates
-        self.processor.update_parameters(rsi_period=10, sma_period=15)
-        assert self.processor.rsi_period == 10
-        assert self.processor.sma_period == 15
+        processor.update_parameters(rsi_period=10, sma_period=15)
+        assert processor.rsi_period == 10
+        assert processor.sma_period == 15
         
-        self.processor.update_parameters(rsi_oversold=25, rsi_overbought=75)
-        assert self.processor.rsi_oversold_threshold == 25
-        assert self.processor.rsi_overbought_threshold == 75
+        processor.update_parameters(rsi_oversold=25, rsi_overbought=75)
+        assert processor.rsi_oversold_threshold == 25
+        assert processor.rsi_overbought_threshold == 75
     
-    def test_update_parameters_invalid(self):
+    def test_update_parameters_invalid(self, processor):
         """Test updating parameters with invalid values."""
         # Test invalid periods
-        with pytest.raises(ValueError, match="RSI period must be positive"):
-            self.processor.update_parameters(rsi_period=0)
+        with pytest.raises(ValueError, match=_RE_RSI_PERIOD):
+            processor.update_parameters(rsi_period=0)
         
-        with pytest.raises(ValueError, match="SMA period must be positive"):
-            self.processor.update_parameters(sma_period=-5)
+        with pytest.raises(ValueError, match=_RE_SMA_PERIOD):
+            processor.update_parameters(sma_period=-5)
         
         # Test invalid thresholds
         with pytest.raises(ValueError, match="RSI oversold threshold must be between 0 and 100"):
-            self.processor.update_parameters(rsi_oversold=-10)
+            processor.update_parameters(rsi_oversold=-10)
         
         with pytest.raises(ValueError, match="RSI overbought threshold must be between 0 and 100"):
-            self.processor.update_parameters(rsi_overbought=150)
+            processor.update_parameters(rsi_overbought=150)
         
         # Test threshold relationship
         with pytest.raises(ValueError, match="RSI oversold threshold must be less than overbought threshold"):
-            self.processor.update_parameters(rsi_oversold=80, rsi_overbought=70)
+            processor.update_parameters(rsi_oversold=80, rsi_overbought=70)
 
 
 class TestSignalProcessorIntegration:
@@ -470,35 +658,11 @@ class TestSignalProcessorIntegration:
         processor = SignalProcessor(rsi_period=14, sma_period=20)
         
         # Create realistic declining then recovering price data
-        base_price = 1.1000
-        
-        # Declining phase (to create oversold RSI)
-        declining_prices = []
-        current_price = base_price
-        for i in range(20):
-            current_price -= 0.0002 + (i * 0.00001)  # Accelerating decline
-            declining_prices.append(current_price)
-        
-        # Recovery phase (to get price above SMA)
-        recovery_prices = []
-        for i in range(10):
-            current_price += 0.0003  # Strong recovery
-            recovery_prices.append(current_price)
-        
-        all_prices = declining_prices + recovery_prices
-        market_data = []
-        base_time = datetime.now() - timedelta(minutes=len(all_prices))
-        
-        for i, price in enumerate(all_prices):
-            market_data.append(MarketData(
-                symbol="EURUSD",
-                timestamp=base_time + timedelta(minutes=i),
-                open_price=price,
-                high_price=price + 0.00005,
-                low_price=price - 0.00005,
-                close_price=price,
-                volume=1000.0
-            ))
+        steps = np.concatenate([
+            -(0.0002 + np.arange(20) * 0.00001),  # Accelerating decline (to create oversold RSI)
+            np.full(10, 0.0003),  # Strong recovery (to get price above SMA)
+        ])
+        market_data = _market_batch(_walk_prices(1.1000, steps), spread=0.00005)
         
         signal = processor.generate_signal(market_data)
         
@@ -513,35 +677,11 @@ class TestSignalProcessorIntegration:
         processor = SignalProcessor(rsi_period=14, sma_period=20)
         
         # Create realistic rising then declining price data
-        base_price = 1.1000
-        
-        # Rising phase (to create overbought RSI)
-        rising_prices = []
-        current_price = base_price
-        for i in range(20):
-            current_price += 0.0002 + (i * 0.00001)  # Accelerating rise
-            rising_prices.append(current_price)
-        
-        # Decline phase (to get price below SMA)
-        decline_prices = []
-        for i in range(10):
-            current_price -= 0.0003  # Sharp decline
-            decline_prices.append(current_price)
-        
-        all_prices = rising_prices + decline_prices
-        market_data = []
-        base_time = datetime.now() - timedelta(minutes=len(all_prices))
-        
-        for i, price in enumerate(all_prices):
-            market_data.append(MarketData(
-                symbol="EURUSD",
-                timestamp=base_time + timedelta(minutes=i),
-                open_price=price,
-                high_price=price + 0.00005,
-                low_price=price - 0.00005,
-                close_price=price,
-                volume=1000.0
-            ))
+        steps = np.concatenate([
+            0.0002 + np.arange(20) * 0.00001,  # Accelerating rise (to create overbought RSI)
+            np.full(10, -0.0003),  # Sharp decline (to get price below SMA)
+        ])
+        market_data = _market_batch(_walk_prices(1.1000, steps), spread=0.00005)
         
         signal = processor.generate_signal(market_data)
         
@@ -555,6 +695,11 @@ class TestSignalProcessorIntegration:
 class TestGlobalSignalProcessor:
     """Test global signal processor functions."""
     
+    @pytest.fixture(autouse=True)
+    def _reset_global(self, monkeypatch):
+        """Start each test without a global instance and restore it afterwards."""
+        monkeypatch.setattr("src.backend.signal_processor._signal_processor", None)
+    
     def test_get_signal_processor_singleton(self):
         """Test that get_signal_processor returns singleton instance."""
         processor1 = get_signal_processor()
@@ -565,10 +710,6 @@ class TestGlobalSignalProcessor:
     
     def test_get_signal_processor_with_parameters(self):
         """Test get_signal_processor with custom parameters."""
-        # Clear global instance first
-        import src.backend.signal_processor
-        src.backend.signal_processor._signal_processor = None
-        
         processor = get_signal_processor(rsi_period=10, sma_period=15)
         
         assert processor.rsi_period == 10
@@ -3,9 +3,12 @@
 
 import asyncio
 import sys
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from typing import List
 
+import numpy as np
+
 # Add src to path
 sys.path.insert(0, 'src')
 
@@ -14,41 +17,64 @@ from backend.models import MarketData, SignalType
 from backend.api_manager import get_api_manager
 
 
+# One processor (default RSI 14 / SMA 20) shared by every check below
+_PROC = get_signal_processor()
+
+_PARAMETER_ATTRS = ("rsi_period", "sma_period", "rsi_oversold_threshold", "rsi_overbought_threshold")
+
+# Candle spacing for the synthetic data, built once rather than per candle
+_MINUTE = timedelta(minutes=1)
+
+
+@contextmanager
+def restored_parameters(processor: SignalProcessor):
+    """Restore the processor's periods and thresholds after a block that changes them."""
+    saved = {name: getattr(processor, name) for name in _PARAMETER_ATTRS}
+    try:
+        yield processor
+    finally:
+        processor.update_parameters(
+            rsi_period=saved["rsi_period"],
+            sma_period=saved["sma_period"],
+            rsi_oversold=saved["rsi_oversold_threshold"],
+            rsi_overbought=saved["rsi_overbought_threshold"]
+        )
+
+
 def create_test_market_data(symbol: str = "EURUSD", num_candles: int = 30) -> List[MarketData]:
     """Create test market data for validation."""
-    market_data = []
     base_price = 1.1000
-    base_time = datetime.now() - timedelta(minutes=num_candles)
+    base_time = datetime.now() - num_candles * _MINUTE
     
     # Create declining then rising pattern to potentially generate signals
-    for i in range(num_candles):
-        if i < num_candles // 2:
-            # Declining phase
-            price_change = -0.0003 * (i / (num_candles // 2))
-        else:
-            # Rising phase
-            price_change = 0.0004 * ((i - num_candles // 2) / (num_candles // 2))
-        
-        current_price = base_price + price_change
-        
-        market_data.append(MarketData(
+    i = np.arange(num_candles)
+    half = num_candles // 2
+    price_change = np.where(
+        i < half,
+        -0.0003 * (i / half),          # Declining phase
+        0.0004 * ((i - half) / half)   # Rising phase
+    )
+    prices = (base_price + price_change).tolist()
+    
+    return [
+        MarketData(
             symbol=symbol,
-            timestamp=base_time + timedelta(minutes=i),
+            timestamp=base_time + minute * _MINUTE,
             open_price=current_price,
             high_price=current_price + 0.00005,
             low_price=current_price - 0.00005,
             close_price=current_price,
             volume=1000.0
-        ))
-    
-    return market_data
+        )
+        for minute, current_price in enumerate(prices)
+    ]
 
 
 def test_rsi_calculation():
     """Test RSI calculation with known data."""
     print("Testing RSI calculation...")
     
-    processor = SignalProcessor()
+    processor = _PROC
     
     # Test with simple rising prices
     rising_prices = [1.0 + i * 0.01 for i in range(20)]
@@ -67,7 +93,7 @@ def test_sma_calculation():
     """Test SMA calculation."""
     print("\nTesting SMA calculation...")
     
-    processor = SignalProcessor()
+    processor = _PROC
     
     # Test with simple data
     prices = [1.0, 1.1, 1.2, 1.3, 1.4]
@@ -84,7 +110,7 @@ def test_signal_generation():
     """Test signal generation logic."""
     print("\nTesting signal generation...")
     
-    processor = SignalProcessor(rsi_period=14, sma_period=20)
+    processor = _PROC
     
     # Create test data
     market_data = create_test_market_data("EURUSD", 30)
@@ -103,6 +129,22 @@ def test_signal_generation():
     else:
         print("No signal generated (neutral conditions)")
     
+    # Stream the remaining candles after seeding; each update must match a full recompute
+    closes = [candle.close_price for candle in market_data]
+    seed_size = max(processor.rsi_period + 1, processor.sma_period)
+    processor.seed_indicators(closes[:seed_size])
+    streamed = np.empty((len(closes) - seed_size, 3))
+    for row, end in enumerate(range(seed_size + 1, len(closes) + 1)):
+        rsi, sma = processor.update_indicators(closes[end - 1])
+        assert abs(rsi - processor.calculate_rsi(closes[:end])) < 1e-12, "Streaming RSI drifted"
+        assert abs(sma - processor.calculate_sma(closes[:end])) < 1e-12, "Streaming SMA drifted"
+        streamed[row] = (closes[end - 1], sma, rsi)
+    print(f"Streaming indicators match bulk over {len(streamed)} updates")
+    
+    # Emit the whole table in one formatted write rather than an f-string per value
+    print("Price   SMA     RSI")
+    np.savetxt(sys.stdout, streamed, fmt="%.5f %.5f %.2f")
+    
     return True
 
 
@@ -110,7 +152,7 @@ def test_technical_indicators():
     """Test technical indicators calculation."""
     print("\nTesting technical indicators...")
     
-    processor = SignalProcessor()
+    processor = _PROC
     market_data = create_test_market_data("EURUSD", 25)
     
     indicators = processor.calculate_technical_indicators(market_data)
@@ -128,15 +170,12 @@ def test_technical_indicators():
     return True
 
 
-async def test_api_integration():
+async def test_api_integration(api_manager):
     """Test API integration (mock mode)."""
     print("\nTesting API integration...")
     
-    # Set up mock mode
-    api_manager = await get_api_manager()
-    api_manager.set_mock_mode(True)
-    
-    processor = SignalProcessor()
+    processor = _PROC
+    processor.api_manager = api_manager
     
     # Test market data fetching and signal generation
     signal = await processor.process_market_data_and_generate_signal("EURUSD")
@@ -147,7 +186,6 @@ async def test_api_integration():
     else:
         print("API integration successful - No signal generated")
     
-    await api_manager.close()
     return True
 
 
@@ -155,19 +193,20 @@ def test_parameter_updates():
     """Test parameter updates."""
     print("\nTesting parameter updates...")
     
-    processor = SignalProcessor()
-    
-    # Test valid updates
-    processor.update_parameters(rsi_period=10, sma_period=15)
-    assert processor.rsi_period == 10
-    assert processor.sma_period == 15
-    print("Parameter updates successful")
+    with restored_parameters(_PROC) as processor:
+        # Test valid updates
+        processor.update_parameters(rsi_period=10, sma_period=15)
+        assert processor.rsi_period == 10
+        assert processor.sma_period == 15
+        print("Parameter updates successful")
+        
+        # Test threshold updates
+        processor.update_parameters(rsi_oversold=25, rsi_overbought=75)
+        assert processor.rsi_oversold_threshold == 25
+        assert processor.rsi_overbought_threshold == 75
+        print("Threshold updates successful")
     
-    # Test threshold updates
-    processor.update_parameters(rsi_oversold=25, rsi_overbought=75)
-    assert processor.rsi_oversold_threshold == 25
-    assert processor.rsi_overbought_threshold == 75
-    print("Threshold updates successful")
+    assert _PROC.rsi_period == 14 and _PROC.sma_period == 20
     
     return True
 
@@ -179,7 +218,7 @@ def test_global_instance():
     processor1 = get_signal_processor()
     processor2 = get_signal_processor()
     
-    assert processor1 is processor2, "Should return same instance"
+    assert processor1 is processor2 is _PROC, "Should return same instance"
     print("Global instance management working correctly")
     
     return True
@@ -198,8 +237,13 @@ async def main():
         test_parameter_updates()
         test_global_instance()
         
-        # Run async tests
-        await test_api_integration()
+        # Run async tests against one mock-mode API manager, closed once at the end
+        api_manager = await get_api_manager()
+        api_manager.set_mock_mode(True)
+        try:
+            await test_api_integration(api_manager)
+        finally:
+            await api_manager.close()
         
         print("\n=== All Tests Passed! ===")
         print("\nSignal Processor Implementation Summary:")
@@ -3,21 +3,34 @@
 
 import os
 import sys
+import tempfile
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
+from backend.config import get_config_manager
+from backend.database import DatabaseManager
+from backend.models import (
+    MarketData, MarketDataBatch, Signal, TradeRequest, TradeResult, Balance,
+    SignalType, TradeDirection
+)
+from backend.utils import (
+    setup_logging, validate_currency_pair, format_currency, calculate_percentage,
+    is_numeric, is_positive_number, sanitize_string, safe_float_conversion,
+    validate_email, clamp_value, calculate_win_rate,
+    validate_market_data, validate_market_data_batch, validate_signal, validate_trade_request
+)
+
+
 def test_data_models():
     """Test data models functionality."""
     print("Testing data models...")
     
-    from backend.models import (
-        MarketData, Signal, TradeRequest, TradeResult, Balance,
-        SignalType, TradeDirection
-    )
-    
     # Test MarketData
     market_data = MarketData(
         symbol="EURUSD",
@@ -80,12 +93,6 @@ def test_utilities():
     """Test utility functions."""
     print("\nTesting utility functions...")
     
-    from backend.utils import (
-        validate_currency_pair, format_currency, calculate_percentage,
-        is_numeric, is_positive_number, sanitize_string, safe_float_conversion,
-        validate_email, clamp_value, calculate_win_rate
-    )
-    
     # Test currency pair validation
     assert validate_currency_pair("EURUSD") == True
     assert validate_currency_pair("INVALID") == False
@@ -145,8 +152,6 @@ def test_configuration():
     os.environ.setdefault("POCKET_OPTION_PASSWORD", "testpass")
     os.environ.setdefault("ALPHA_VANTAGE_API_KEY", "testapikey123")
     
-    from backend.config import get_config_manager
-    
     try:
         config_manager = get_config_manager()
         
@@ -167,19 +172,11 @@ def test_database():
     """Test database functionality."""
     print("\nTesting database functionality...")
     
-    import tempfile
-    from backend.database import DatabaseManager
-    from backend.models import TradeResult, TradeDirection
-    
-    # Create temporary database
-    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as temp_file:
-        temp_db_path = temp_file.name
+    # In-memory database: no temp file to create or delete
+    db_manager = DatabaseManager(":memory:")
+    print("✓ Database initialized")
     
     try:
-        # Initialize database
-        db_manager = DatabaseManager(temp_db_path)
-        print("✓ Database initialized")
-        
         # Create test trade
         trade = TradeResult(
             trade_id="validation_test",
@@ -211,18 +208,13 @@ def test_database():
         print("✓ Performance metrics calculated")
         
     finally:
-        # Cleanup
-        if os.path.exists(temp_db_path):
-            os.unlink(temp_db_path)
+        db_manager.close()
 
 
 def test_data_validation():
     """Test data validation functions."""
     print("\nTesting data validation...")
     
-    from backend.utils import validate_market_data, validate_signal, validate_trade_request
-    from backend.models import MarketData, Signal, TradeRequest, SignalType, TradeDirection
-    
     # Test market data validation
     market_data = MarketData(
         symbol="EURUSD",
@@ -238,6 +230,22 @@ def test_data_validation():
     assert result.is_valid == True
     print("✓ Market data validation working")
     
+    # Test batch validation over columnar candles
+    closes = np.array([1.1000, 1.1010, 1.1025, 1.1015])
+    batch = MarketDataBatch(
+        symbol="EURUSD",
+        timestamp=np.datetime64(datetime.now(), "us") - np.arange(4)[::-1].astype("timedelta64[m]"),
+        open_price=closes,
+        high_price=closes + 0.0005,
+        low_price=closes - 0.0005,
+        close_price=closes,
+        volume=np.full(4, 1000.0)
+    )
+    
+    result = validate_market_data_batch(batch)
+    assert result.is_valid == True
+    print("✓ Market data batch validation working")
+    
     # Test signal validation
     signal = Signal(
         symbol="EURUSD",
@@ -271,10 +279,6 @@ def test_logging():
     """Test logging setup."""
     print("\nTesting logging setup...")
     
-    import tempfile
-    from backend.utils import setup_logging
-    from unittest.mock import patch
-    
     with tempfile.TemporaryDirectory() as temp_dir:
         log_file = Path(temp_dir) / "test.log"
         